@@ -40,11 +40,11 @@ class AccessControlFileReader:
         schema_definition_filepath (str): Path to the JSON schema definition file.
 
     Attributes:
-        _excluded_ou_names (list[str]): List of excluded organizational unit names.
-        _excluded_account_names (list[str]): List of excluded account names.
-        _excluded_sso_user_names (list[str]): List of excluded SSO user names.
-        _excluded_sso_group_names (list[str]): List of excluded SSO group names.
-        _excluded_permission_set_names (list[str]): List of excluded permission set names.
+        _excluded_ou_names (frozenset[str]): Set of excluded organizational unit names.
+        _excluded_account_names (frozenset[str]): Set of excluded account names.
+        _excluded_sso_user_names (frozenset[str]): Set of excluded SSO user names.
+        _excluded_sso_group_names (frozenset[str]): Set of excluded SSO group names.
+        _excluded_permission_set_names (frozenset[str]): Set of excluded permission set names.
 
     Raises:
         jsonschema.ValidationError: If the manifest file does not conform to the schema.
@@ -75,11 +75,11 @@ class AccessControlFileReader:
         self._manifest_definition_filepath: str = manifest_definition_filepath
 
         # Initialize exclusion lists
-        self._excluded_ou_names: list[str] = []
-        self._excluded_account_names: list[str] = []
-        self._excluded_sso_user_names: list[str] = []
-        self._excluded_sso_group_names: list[str] = []
-        self._excluded_permission_set_names: list[str] = []
+        self._excluded_ou_names: frozenset[str] = frozenset()
+        self._excluded_account_names: frozenset[str] = frozenset()
+        self._excluded_sso_user_names: frozenset[str] = frozenset()
+        self._excluded_sso_group_names: frozenset[str] = frozenset()
+        self._excluded_permission_set_names: frozenset[str] = frozenset()
 
         # Keys to convert to uppercase
         self._manifest_file_keys_to_uppercase: list[str] = [
@@ -124,19 +124,30 @@ class AccessControlFileReader:
         Generate lists of excluded targets from the manifest file.
 
         Populates exclusion lists for different target types based on
-        the 'ignore' section of the manifest file.
+        the 'ignore' section of the manifest file. Exclusions are frozen
+        into sets so membership checks against them are O(1).
         """
-        target_map = {
-            OU_TARGET_TYPE_LABEL: self._excluded_ou_names,
-            ACCOUNT_TARGET_TYPE_LABEL: self._excluded_account_names,
-            USER_PRINCIPAL_TYPE_LABEL: self._excluded_sso_user_names,
-            GROUP_PRINCIPAL_TYPE_LABEL: self._excluded_sso_group_names,
-            PERMISSION_SET_TYPE_LABEL: self._excluded_permission_set_names,
-        }
-
+        excluded_target_names: dict[str, list[str]] = {}
         for item in self._manifest_definition.get("ignore", []):
-            target_list = target_map.get(item["target_type"])
-            target_list.extend(item["target_names"])
+            excluded_target_names.setdefault(item["target_type"], []).extend(
+                item["target_names"]
+            )
+
+        self._excluded_ou_names = frozenset(
+            excluded_target_names.get(OU_TARGET_TYPE_LABEL, [])
+        )
+        self._excluded_account_names = frozenset(
+            excluded_target_names.get(ACCOUNT_TARGET_TYPE_LABEL, [])
+        )
+        self._excluded_sso_user_names = frozenset(
+            excluded_target_names.get(USER_PRINCIPAL_TYPE_LABEL, [])
+        )
+        self._excluded_sso_group_names = frozenset(
+            excluded_target_names.get(GROUP_PRINCIPAL_TYPE_LABEL, [])
+        )
+        self._excluded_permission_set_names = frozenset(
+            excluded_target_names.get(PERMISSION_SET_TYPE_LABEL, [])
+        )
 
     @property
     def rbac_rules(self) -> list:
@@ -149,51 +160,51 @@ class AccessControlFileReader:
         return self._manifest_definition.get("rbac_rules", [])
 
     @property
-    def excluded_ou_names(self) -> list[str]:
+    def excluded_ou_names(self) -> frozenset[str]:
         """
-        Get the list of excluded organizational unit names.
+        Get the set of excluded organizational unit names.
 
         Returns:
-            list[str]: Names of organizational units to be excluded.
+            frozenset[str]: Names of organizational units to be excluded.
         """
         return self._excluded_ou_names
 
     @property
-    def excluded_account_names(self) -> list[str]:
+    def excluded_account_names(self) -> frozenset[str]:
         """
-        Get the list of excluded account names.
+        Get the set of excluded account names.
 
         Returns:
-            list[str]: Names of accounts to be excluded.
+            frozenset[str]: Names of accounts to be excluded.
         """
         return self._excluded_account_names
 
     @property
-    def excluded_sso_user_names(self) -> list[str]:
+    def excluded_sso_user_names(self) -> frozenset[str]:
         """
-        Get the list of excluded SSO user names.
+        Get the set of excluded SSO user names.
 
         Returns:
-            list[str]: Names of SSO users to be excluded.
+            frozenset[str]: Names of SSO users to be excluded.
         """
         return self._excluded_sso_user_names
 
     @property
-    def excluded_sso_group_names(self) -> list[str]:
+    def excluded_sso_group_names(self) -> frozenset[str]:
         """
-        Get the list of excluded SSO group names.
+        Get the set of excluded SSO group names.
 
         Returns:
-            list[str]: Names of SSO groups to be excluded.
+            frozenset[str]: Names of SSO groups to be excluded.
         """
         return self._excluded_sso_group_names
 
     @property
-    def excluded_permission_set_names(self) -> list[str]:
+    def excluded_permission_set_names(self) -> frozenset[str]:
         """
-        Get the list of excluded permission set names.
+        Get the set of excluded permission set names.
 
         Returns:
-            list[str]: Names of permission sets to be excluded.
+            frozenset[str]: Names of permission sets to be excluded.
         """
         return self._excluded_permission_set_names
@@ -5,6 +5,39 @@ Module with constants to use throughout the src/services modules
 # General constants for retry mechanisms
 MAX_RETRIES = 5  # Maximum number of retry attempts for operations that may fail
 RETRY_DELAY_SECONDS = 2.0  # Delay between retry attempts in seconds
+RETRY_BUDGET_SECONDS = 60.0  # Wall-clock limit on one decorated call, retries and backoff included, before it gives up
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 20  # Consecutive retryable failures of one decorated method before its circuit opens
+CIRCUIT_BREAKER_COOLDOWN_SECONDS = (
+    30.0  # Seconds an open circuit fails fast before letting a probe call through
+)
+
+# Pagination and concurrency constants for AWS API calls
+ORGANIZATIONS_MAX_PAGE_SIZE = (
+    20  # Largest MaxResults accepted by the AWS Organizations list APIs
+)
+IDENTITY_CENTER_MAX_PAGE_SIZE = (
+    100  # Largest MaxResults accepted by the SSO Admin and Identity Store list APIs
+)
+MAX_CONCURRENT_AWS_REQUESTS = (
+    10  # Maximum number of in-flight AWS API calls per worker pool
+)
+MAX_CONCURRENT_ASSIGNMENT_OPERATIONS = (
+    10  # Maximum number of account assignments created or deleted at once
+)
+AWS_MAX_POOL_CONNECTIONS = 64  # HTTPS connections kept per boto3 client, large enough that worker pools never queue on a socket
+AWS_CLIENT_MAX_ATTEMPTS = 1  # Total attempts botocore makes per API call, including the first; retries are left to handle_aws_exceptions
+AWS_CLIENT_RETRY_MODE = "adaptive"  # Botocore retry mode; "adaptive" adds client-side rate limiting when throttled
+ORGANIZATIONS_REQUESTS_PER_SECOND = 10.0  # Client-side ceiling on AWS Organizations API requests per second, every paginator page included
+IDENTITY_CENTER_REQUESTS_PER_SECOND = 20.0  # Client-side ceiling on SSO Admin and Identity Store API requests per second, per service
+AWS_REQUESTS_PER_SECOND_ENV_VAR = "SSO_MANAGER_AWS_REQUESTS_PER_SECOND"  # Environment variable overriding the client-side request rate of every AWS service; 0 disables it
+
+# On-disk cache constants for discovered AWS resource maps
+CACHE_DIR_ENV_VAR = (
+    "SSO_MANAGER_CACHE_DIR"  # Environment variable overriding the cache directory
+)
+CACHE_TTL_ENV_VAR = "SSO_MANAGER_CACHE_TTL_SECONDS"  # Environment variable setting the cache lifetime; unset or 0 disables caching
+DEFAULT_CACHE_DIR = "~/.cache/sso-entitlements-manager"  # Cache directory used when CACHE_DIR_ENV_VAR is not set
+AWS_READ_CACHE_MAX_ENTRIES = 1024  # Results kept per cached AWS read method before the least recently used is evicted
 
 # AWS service and identity constants for type labeling
 OU_TARGET_TYPE_LABEL = (
@@ -10,19 +10,32 @@ class SubscriptableDataclass:
     A base class that makes dataclasses subscriptable and convertible to dictionaries.
 
     Provides dictionary-like access to dataclass fields and conversion to dictionary format.
+    Declares empty __slots__ so subclasses defined with slots=True carry no instance __dict__.
     """
 
+    __slots__ = ()
+
     def __getitem__(self, key: str) -> str:
         """
         Enables dictionary-style access to dataclass fields.
 
+        Reads the field directly instead of converting the whole instance
+        to a dictionary on every access.
+
         Args:
             key (str): The field name to access
 
         Returns:
             str: The value of the requested field
+
+        Raises:
+            KeyError: If the key is not a field of the dataclass
         """
-        return asdict(self)[key]
+        # pylint: disable=no-member
+        # __dataclass_fields__ is set by the @dataclass decorator on subclasses.
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
 
     def to_dict(self) -> dict[str, str]:
         """
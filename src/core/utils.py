@@ -6,6 +6,7 @@ and file handling tasks across the repository. It includes utilities for:
     - Dictionary transformations
     - List conversions
     - File loading
+    - On-disk caching of discovered resource maps
     - Logging setup
 
 The functions are designed to be flexible, reusable, and support various data processing needs.
@@ -15,10 +16,13 @@ Key Features:
     - List to dictionary conversion
     - Key-based uppercase conversion
     - YAML and JSON file loading
+    - TTL-bound JSON cache files
     - Flexible logging configuration
 """
 
+import os
 import json
+import time
 import atexit
 import pathlib
 import logging
@@ -29,6 +33,8 @@ from rich import box
 from rich.table import Table
 from rich.console import Console
 
+from src.core.constants import CACHE_DIR_ENV_VAR, CACHE_TTL_ENV_VAR, DEFAULT_CACHE_DIR
+
 
 def dict_reverse_lookup(original_dict: dict, lookup_value: str):
     """
@@ -183,6 +189,98 @@ def load_file(filepath: str) -> dict:
         )
 
 
+def _get_cache_filepath(cache_name: str) -> pathlib.Path:
+    """
+    Resolves the path of a named cache file.
+
+    Args:
+        cache_name (str): Name of the cache entry, without extension.
+
+    Returns:
+        pathlib.Path: Path of the JSON cache file inside the cache directory.
+    """
+    cache_dir = os.environ.get(CACHE_DIR_ENV_VAR, DEFAULT_CACHE_DIR)
+    return pathlib.Path(cache_dir).expanduser() / f"{cache_name}.json"
+
+
+def get_cache_ttl_seconds() -> float:
+    """
+    Reads the cache lifetime from the environment.
+
+    Returns:
+        float: The cache lifetime in seconds. Zero when the environment
+        variable is unset or invalid, which disables caching.
+    """
+    try:
+        return max(float(os.environ.get(CACHE_TTL_ENV_VAR, 0)), 0.0)
+    except ValueError:
+        return 0.0
+
+
+def read_cache(cache_name: str, check_expiry: bool = True) -> dict | None:
+    """
+    Loads a named cache entry if caching is enabled and the entry is fresh.
+
+    Freshness is decided from the cache file's modification time, so a
+    cache hit costs a single stat and a single file read.
+
+    Args:
+        cache_name (str): Name of the cache entry, without extension.
+        check_expiry (bool, optional): Whether entries older than the cache
+            TTL are discarded. Disable only for data that can never go stale.
+            Defaults to True.
+
+    Returns:
+        dict | None: The cached data, or None when caching is disabled, the
+        entry does not exist, has expired, or cannot be parsed.
+
+    Examples:
+        >>> read_cache('organization_map.r-ab12')
+        {'ou_name_id_map': {'root': 'r-ab12'}, ...}
+    """
+    cache_ttl_seconds = get_cache_ttl_seconds()
+    if not cache_ttl_seconds:
+        return None
+
+    cache_file = _get_cache_filepath(cache_name)
+    try:
+        if (
+            check_expiry
+            and time.time() - cache_file.stat().st_mtime > cache_ttl_seconds
+        ):
+            return None
+        with open(cache_file, "r", encoding="utf-8") as fp:
+            return json.load(fp)
+    except (OSError, ValueError):
+        return None
+
+
+def write_cache(cache_name: str, data: dict) -> None:
+    """
+    Persists a named cache entry if caching is enabled.
+
+    The entry is written to a temporary file and then moved into place, so
+    concurrent readers never observe a partially written cache file.
+
+    Args:
+        cache_name (str): Name of the cache entry, without extension.
+        data (dict): JSON-serializable data to cache.
+
+    Note:
+        - Does nothing unless the cache TTL environment variable is set
+        - Creates the cache directory if it doesn't exist
+    """
+    if not get_cache_ttl_seconds():
+        return
+
+    cache_file = _get_cache_filepath(cache_name)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_cache_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_cache_file, "w", encoding="utf-8") as fp:
+        json.dump(data, fp)
+    os.replace(tmp_cache_file, cache_file)
+
+
 def setup_logging(
     log_level: str = "INFO",
     logging_config_filepath: str = "logging/configs/config.json",
@@ -14,6 +14,7 @@ Key Features:
     - Generation of account assignments based on manifest file rules
     - Support for automatic or manual approval of access changes
     - Detailed reporting of invalid assignments
+    - Optional on-disk caching of SSO principals and permission sets
 
 Example:
     # Initialize the manager (auto-discovers Identity Center details)
@@ -38,12 +39,13 @@ Note:
     - identitystore:ListGroups
 """
 
+import sys
 import logging
 import itertools
-from typing import Literal
+from typing import Callable, Literal
 from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-import boto3
 from mypy_boto3_sso_admin import SSOAdminClient
 from mypy_boto3_sso_admin.paginator import (
     ListAccountAssignmentsForPrincipalPaginator,
@@ -55,14 +57,19 @@ from mypy_boto3_identitystore.paginator import (
     ListUsersPaginator,
 )
 from rich.progress import track
-from src.services.aws.utils import handle_aws_exceptions
+from src.services.aws.utils import get_aws_client, handle_aws_exceptions
 from src.services.aws.exceptions import (
     PermissionSetNotFoundError,
     SSOPrincipalNotFoundError,
     AWSAccountOrOrgNotFoundError,
 )
 from src.core.custom_classes import SubscriptableDataclass
-from src.core.utils import dict_reverse_lookup, create_display_table
+from src.core.utils import (
+    dict_reverse_lookup,
+    create_display_table,
+    read_cache,
+    write_cache,
+)
 from src.core.constants import (
     OU_TARGET_TYPE_LABEL,
     ACCOUNT_TARGET_TYPE_LABEL,
@@ -70,6 +77,9 @@ from src.core.constants import (
     GROUP_PRINCIPAL_TYPE_LABEL,
     PERMISSION_SET_TYPE_LABEL,
     SSO_ENTITLMENTS_APP_NAME,
+    MAX_CONCURRENT_AWS_REQUESTS,
+    MAX_CONCURRENT_ASSIGNMENT_OPERATIONS,
+    IDENTITY_CENTER_MAX_PAGE_SIZE,
     OU_INVALID_ERROR_CODE,
     OU_INVALID_ERROR_MESSAGE,
     ACCOUNT_INVALID_ERROR_CODE,
@@ -82,8 +92,12 @@ from src.core.constants import (
     PERMISSION_SET_INVALID_ERROR_MESSAGE,
 )
 
+# Define constants
+SSO_ENVIRONMENT_CACHE_PREFIX = "sso_environment"
+PERMISSION_SET_NAMES_CACHE_PREFIX = "permission_set_names"
+
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class InvalidAssignmentRule(SubscriptableDataclass):
     """
     Represents an invalid assignment rule encountered during RBAC processing.
@@ -103,7 +117,7 @@ class InvalidAssignmentRule(SubscriptableDataclass):
     resource_invalid_error_message: str
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class AccountAssignment(SubscriptableDataclass):
     """
     Represents an AWS SSO account assignment.
@@ -154,33 +168,42 @@ class IdentityCenterManager:
             (OUs, accounts, groups, users, and permission sets).
     """
 
-    def __init__(self) -> None:
+    def __init__(self, force_refresh: bool = False) -> None:
         """
         Initialize the AWS Identity Center manager and set up SSO environment mapping.
 
         The Identity Store ARN and ID are automatically discovered from AWS Identity Center.
 
+        Args:
+            force_refresh (bool, optional): Map the SSO environment from AWS even
+                if a fresh cached copy exists. Defaults to False.
+
         Note:
             This method automatically maps the SSO environment and lists current
             account assignments during instantiation. AWS resources are auto-discovered.
+            When SSO_MANAGER_CACHE_TTL_SECONDS is set, a fresh cached copy of the
+            SSO users, groups and permission sets for the same identity store is
+            loaded instead of listing them. Current account assignments are never
+            cached, as applying a manifest changes them.
         """
         # Define logger first
         self._logger: logging.Logger = logging.getLogger(SSO_ENTITLMENTS_APP_NAME)
 
         # Define boto3 clients
-        self._sso_admin_client: SSOAdminClient = boto3.client("sso-admin")
-        self._identity_store_client: IdentityStoreClient = boto3.client("identitystore")
+        self._sso_admin_client: SSOAdminClient = get_aws_client("sso-admin")
+        self._identity_store_client: IdentityStoreClient = get_aws_client(
+            "identitystore"
+        )
 
         # Auto-discover Identity Center details
         self._logger.info("Auto-discovering Identity Center details...")
 
-        response = self._sso_admin_client.list_instances()
-        instance = response["Instances"][0]
+        instance = self._discover_sso_instance()
 
         self._identity_store_id = instance["IdentityStoreId"]
-        self._identity_store_arn = instance[
-            "InstanceArn"
-        ]  # This is the SSO instance ARN we need
+        # This is the SSO instance ARN we need. It is carried by every account
+        # assignment, so interning it lets them all share one string object
+        self._identity_store_arn = sys.intern(instance["InstanceArn"])
 
         self._logger.info("Discovered Identity Store ID: %s", self._identity_store_id)
         self._logger.info("Discovered SSO Instance ARN: %s", self._identity_store_arn)
@@ -207,6 +230,11 @@ class IdentityCenterManager:
         self._list_permission_sets_paginator: ListPermissionSetsPaginator = (
             self._sso_admin_client.get_paginator("list_permission_sets")
         )
+        self._list_principal_assignments_paginator: (
+            ListAccountAssignmentsForPrincipalPaginator
+        ) = self._sso_admin_client.get_paginator(
+            "list_account_assignments_for_principal"
+        )
 
         # Define assignment variables
         self._local_account_assignments: list[AccountAssignment] = []
@@ -219,10 +247,48 @@ class IdentityCenterManager:
         self._invalid_manifest_file_rules: list[InvalidAssignmentRule] = []
 
         # Setup workflow
-        self._map_sso_environment()
+        cache_name = f"{SSO_ENVIRONMENT_CACHE_PREFIX}.{self._identity_store_id}"
+        if not force_refresh and self._load_cached_sso_environment(cache_name):
+            self._logger.info("Loaded SSO environment from cache")
+        else:
+            self._map_sso_environment()
+            write_cache(
+                cache_name,
+                {
+                    "sso_users": self.sso_users,
+                    "sso_groups": self.sso_groups,
+                    "sso_permission_sets": self.sso_permission_sets,
+                },
+            )
         self._list_current_account_assignments()
 
-    @handle_aws_exceptions()
+    def _load_cached_sso_environment(self, cache_name: str) -> bool:
+        """
+        Populates the SSO principal and permission set maps from the on-disk cache.
+
+        Args:
+            cache_name (str): Name of the cache entry for this identity store.
+
+        Returns:
+            bool: True if the maps were loaded from the cache, False if the
+            cache is disabled, missing, expired or malformed.
+        """
+        cached_sso_environment = read_cache(cache_name)
+        if not cached_sso_environment:
+            return False
+
+        try:
+            sso_users = dict(cached_sso_environment["sso_users"])
+            sso_groups = dict(cached_sso_environment["sso_groups"])
+            sso_permission_sets = dict(cached_sso_environment["sso_permission_sets"])
+        except (KeyError, TypeError, ValueError):
+            return False
+
+        self.sso_users = sso_users
+        self.sso_groups = sso_groups
+        self.sso_permission_sets = sso_permission_sets
+        return True
+
     def _map_sso_environment(self) -> None:
         """
         Maps the current SSO environment by populating SSO resources.
@@ -237,25 +303,18 @@ class IdentityCenterManager:
 
         Note:
             Uses AWS Organizations API pagination to handle large numbers
-            of groups, users, and permission sets.
+            of groups, users, and permission sets. The three are independent,
+            so they are mapped concurrently and the maps are assigned here
+            once all of them are complete.
         """
-        # SSO Groups
-        self._logger.info("Mapping SSO groups")
-        sso_groups_pages = self._list_groups_paginator.paginate(
-            IdentityStoreId=self._identity_store_id
-        )
-        for page in sso_groups_pages:
-            for group in page.get("Groups", []):
-                self.sso_groups[group["DisplayName"]] = group["GroupId"]
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            sso_groups_future = executor.submit(self._map_sso_groups)
+            sso_users_future = executor.submit(self._map_sso_users)
+            sso_permission_sets_future = executor.submit(self._map_sso_permission_sets)
 
-        # SSO Users
-        self._logger.info("Mapping SSO users")
-        sso_users_pages = self._list_sso_users_pagniator.paginate(
-            IdentityStoreId=self._identity_store_id
-        )
-        for page in sso_users_pages:
-            for user in page.get("Users", []):
-                self.sso_users[user["UserName"]] = user["UserId"]
+            self.sso_groups = sso_groups_future.result()
+            self.sso_users = sso_users_future.result()
+            self.sso_permission_sets = sso_permission_sets_future.result()
 
         if not (self.sso_groups and self.sso_users):
             self._logger.error(
@@ -266,24 +325,6 @@ class IdentityCenterManager:
                 "EMPTY_TENANT",
             )
 
-        # SSO Permission Sets
-        self._logger.info("Mapping SSO permission sets")
-        permission_sets_pages = self._list_permission_sets_paginator.paginate(
-            InstanceArn=self._identity_store_arn
-        )
-        for page in permission_sets_pages:
-            for permission_set in page.get("PermissionSets", []):
-                described_permission_set = (
-                    self._sso_admin_client.describe_permission_set(
-                        InstanceArn=self._identity_store_arn,
-                        PermissionSetArn=permission_set,
-                    )
-                )
-                permission_set = described_permission_set.get("PermissionSet")
-                self.sso_permission_sets[permission_set["Name"]] = permission_set[
-                    "PermissionSetArn"
-                ]
-
         if not self.sso_permission_sets:
             self._logger.error(
                 "No permission sets found to assign to groups or users principals"
@@ -294,6 +335,127 @@ class IdentityCenterManager:
             )
 
     @handle_aws_exceptions()
+    def _discover_sso_instance(self) -> dict[str, str]:
+        """Returns the account's Identity Center instance and its identity store."""
+        response = self._sso_admin_client.list_instances()
+        return response["Instances"][0]
+
+    @handle_aws_exceptions()
+    def _map_sso_groups(self) -> dict[str, str]:
+        """
+        Maps SSO group names to their group IDs.
+
+        Returns:
+            dict[str, str]: A dictionary mapping group display names to group IDs.
+        """
+        self._logger.info("Mapping SSO groups")
+        sso_groups_pages = self._list_groups_paginator.paginate(
+            IdentityStoreId=self._identity_store_id,
+            PaginationConfig={"PageSize": IDENTITY_CENTER_MAX_PAGE_SIZE},
+        )
+        return dict(
+            (group["DisplayName"], group["GroupId"])
+            for page in sso_groups_pages
+            for group in page.get("Groups", ())
+        )
+
+    @handle_aws_exceptions()
+    def _map_sso_users(self) -> dict[str, str]:
+        """
+        Maps SSO usernames to their user IDs.
+
+        Returns:
+            dict[str, str]: A dictionary mapping usernames to user IDs.
+        """
+        self._logger.info("Mapping SSO users")
+        sso_users_pages = self._list_sso_users_pagniator.paginate(
+            IdentityStoreId=self._identity_store_id,
+            PaginationConfig={"PageSize": IDENTITY_CENTER_MAX_PAGE_SIZE},
+        )
+        return dict(
+            (user["UserName"], user["UserId"])
+            for page in sso_users_pages
+            for user in page.get("Users", ())
+        )
+
+    def _map_sso_permission_sets(self) -> dict[str, str]:
+        """
+        Maps SSO permission set names to their ARNs.
+
+        The permission set listing only returns ARNs, so each permission set
+        is then described concurrently, bounded by MAX_CONCURRENT_AWS_REQUESTS,
+        to resolve its name. Permission sets cannot be renamed, so when caching
+        is enabled resolved names are kept on disk without expiry and only
+        ARNs not seen before are described. Only the listing and each
+        describe call are retried, never this method as a whole.
+
+        Returns:
+            dict[str, str]: A dictionary mapping permission set names to ARNs.
+        """
+        self._logger.info("Mapping SSO permission sets")
+        permission_set_arns = self._list_permission_set_arns()
+
+        cache_name = f"{PERMISSION_SET_NAMES_CACHE_PREFIX}.{self._identity_store_id}"
+        permission_set_arn_name_map = read_cache(cache_name, check_expiry=False) or {}
+        undescribed_permission_set_arns = [
+            permission_set_arn
+            for permission_set_arn in permission_set_arns
+            if permission_set_arn not in permission_set_arn_name_map
+        ]
+        if undescribed_permission_set_arns:
+            with ThreadPoolExecutor(
+                max_workers=MAX_CONCURRENT_AWS_REQUESTS
+            ) as executor:
+                permission_set_arn_name_map.update(
+                    (permission_set["PermissionSetArn"], permission_set["Name"])
+                    for permission_set in executor.map(
+                        self._describe_permission_set, undescribed_permission_set_arns
+                    )
+                )
+            write_cache(
+                cache_name,
+                {
+                    permission_set_arn: permission_set_arn_name_map[permission_set_arn]
+                    for permission_set_arn in permission_set_arns
+                },
+            )
+
+        return dict(
+            (permission_set_arn_name_map[permission_set_arn], permission_set_arn)
+            for permission_set_arn in permission_set_arns
+        )
+
+    @handle_aws_exceptions()
+    def _list_permission_set_arns(self) -> list[str]:
+        """Lists the ARNs of every permission set in the SSO instance, in order."""
+        permission_sets_pages = self._list_permission_sets_paginator.paginate(
+            InstanceArn=self._identity_store_arn,
+            PaginationConfig={"PageSize": IDENTITY_CENTER_MAX_PAGE_SIZE},
+        )
+        return [
+            permission_set_arn
+            for page in permission_sets_pages
+            for permission_set_arn in page.get("PermissionSets", ())
+        ]
+
+    @handle_aws_exceptions()
+    def _describe_permission_set(self, permission_set_arn: str) -> dict[str, str]:
+        """
+        Describes a single permission set.
+
+        Args:
+            permission_set_arn (str): The ARN of the permission set to describe.
+
+        Returns:
+            dict[str, str]: The permission set details, including its
+            'Name' and 'PermissionSetArn'.
+        """
+        described_permission_set = self._sso_admin_client.describe_permission_set(
+            InstanceArn=self._identity_store_arn,
+            PermissionSetArn=permission_set_arn,
+        )
+        return described_permission_set["PermissionSet"]
+
     def _list_current_account_assignments(self) -> None:
         """
         Lists the current account assignments for principals in the identity store.
@@ -301,33 +463,65 @@ class IdentityCenterManager:
         This method:
             - Retrieves existing account assignments for users and groups
             - Populates _current_account_assignments list
-            - Standardizes assignment dictionary format
+            - Standardizes assignments into AccountAssignment objects
 
         Note:
             Uses AWS SSO Admin API pagination to handle large read requests
-            of account assignments in a paginated manner.
+            of account assignments in a paginated manner. Principals are
+            listed concurrently, bounded by MAX_CONCURRENT_AWS_REQUESTS, and
+            their assignments are collected in principal order.
         """
-        principal_type_map = {"USER": self.sso_users, "GROUP": self.sso_groups}
-        principal_assignments_paginator: ListAccountAssignmentsForPrincipalPaginator = (
-            self._sso_admin_client.get_paginator(
-                "list_account_assignments_for_principal"
-            )
+        principal_ids_by_type = (
+            (USER_PRINCIPAL_TYPE_LABEL, tuple(self.sso_users.values())),
+            (GROUP_PRINCIPAL_TYPE_LABEL, tuple(self.sso_groups.values())),
         )
-
-        for principal_type, principals in principal_type_map.items():
-            for principal_id in principals.values():
-                assignments_iterator = principal_assignments_paginator.paginate(
-                    PrincipalId=principal_id,
-                    InstanceArn=self._identity_store_arn,
-                    PrincipalType=principal_type,
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_AWS_REQUESTS) as executor:
+            principal_assignments_futures = [
+                executor.submit(
+                    self._list_principal_account_assignments,
+                    principal_id,
+                    principal_type,
                 )
-                for page in assignments_iterator:
-                    self._current_account_assignments.extend(page["AccountAssignments"])
+                for principal_type, principal_ids in principal_ids_by_type
+                for principal_id in principal_ids
+            ]
+            for future in principal_assignments_futures:
+                self._current_account_assignments.extend(future.result())
+
+    @handle_aws_exceptions()
+    def _list_principal_account_assignments(
+        self, principal_id: str, principal_type: str
+    ) -> list[AccountAssignment]:
+        """
+        Lists the account assignments of a single principal.
+
+        Each assignment returned by the SSO Admin API is built straight into
+        an AccountAssignment, keyed by TargetId and tagged with the instance ARN.
 
-        for i, assignment in enumerate(self._current_account_assignments):
-            assignment["InstanceArn"] = self._identity_store_arn
-            assignment["TargetId"] = assignment.pop("AccountId")
-            self._current_account_assignments[i] = AccountAssignment(**assignment)
+        Args:
+            principal_id (str): The ID of the principal (user or group).
+            principal_type (str): The type of principal (USER or GROUP).
+
+        Returns:
+            list[AccountAssignment]: The principal's current account assignments.
+        """
+        assignments_iterator = self._list_principal_assignments_paginator.paginate(
+            PrincipalId=principal_id,
+            InstanceArn=self._identity_store_arn,
+            PrincipalType=principal_type,
+            PaginationConfig={"PageSize": IDENTITY_CENTER_MAX_PAGE_SIZE},
+        )
+        return [
+            AccountAssignment(
+                TargetId=assignment["AccountId"],
+                PrincipalId=assignment["PrincipalId"],
+                PrincipalType=principal_type,
+                PermissionSetArn=assignment["PermissionSetArn"],
+                InstanceArn=self._identity_store_arn,
+            )
+            for page in assignments_iterator
+            for assignment in page["AccountAssignments"]
+        ]
 
     def _generate_rbac_assignments(self) -> None:
         """
@@ -346,6 +540,39 @@ class IdentityCenterManager:
             - Target accounts and organizational units
         """
 
+        resource_maps = {
+            OU_TARGET_TYPE_LABEL: (
+                self.ou_accounts_map,
+                OU_INVALID_ERROR_CODE,
+                OU_INVALID_ERROR_MESSAGE,
+                AWSAccountOrOrgNotFoundError,
+            ),
+            ACCOUNT_TARGET_TYPE_LABEL: (
+                self.account_name_id_map,
+                ACCOUNT_INVALID_ERROR_CODE,
+                ACCOUNT_INVALID_ERROR_MESSAGE,
+                AWSAccountOrOrgNotFoundError,
+            ),
+            GROUP_PRINCIPAL_TYPE_LABEL: (
+                self.sso_groups,
+                SSO_GROUP_INVALID_ERROR_CODE,
+                SSO_GROUP_INVALID_ERROR_MESSAGE,
+                SSOPrincipalNotFoundError,
+            ),
+            USER_PRINCIPAL_TYPE_LABEL: (
+                self.sso_users,
+                SSO_USER_INVALID_ERROR_CODE,
+                SSO_USER_INVALID_ERROR_MESSAGE,
+                SSOPrincipalNotFoundError,
+            ),
+            PERMISSION_SET_TYPE_LABEL: (
+                self.sso_permission_sets,
+                PERMISSION_SET_INVALID_ERROR_CODE,
+                PERMISSION_SET_INVALID_ERROR_MESSAGE,
+                PermissionSetNotFoundError,
+            ),
+        }
+
         def validate_aws_resource(
             rule_number: int, resource_name: str, resource_type: str
         ) -> str:
@@ -358,83 +585,46 @@ class IdentityCenterManager:
                 resource_type (str): Type of the resource (e.g., OU, account, group).
 
             Returns:
-                Optional[str]: The validated resource ID or None if invalid.
-            """
-            resource_maps = {
-                OU_TARGET_TYPE_LABEL: {
-                    "resource_map": self.ou_accounts_map,
-                    "invalid_resource_names": self._invalid_manifest_file_rules,
-                    "resource_invalid_error_message": OU_INVALID_ERROR_MESSAGE,
-                    "resource_invalid_error_code": OU_INVALID_ERROR_CODE,
-                },
-                ACCOUNT_TARGET_TYPE_LABEL: {
-                    "resource_map": self.account_name_id_map,
-                    "invalid_resource_names": self._invalid_manifest_file_rules,
-                    "resource_invalid_error_message": ACCOUNT_INVALID_ERROR_MESSAGE,
-                    "resource_invalid_error_code": ACCOUNT_INVALID_ERROR_CODE,
-                },
-                GROUP_PRINCIPAL_TYPE_LABEL: {
-                    "resource_map": self.sso_groups,
-                    "invalid_resource_names": self._invalid_manifest_file_rules,
-                    "resource_invalid_error_message": SSO_GROUP_INVALID_ERROR_MESSAGE,
-                    "resource_invalid_error_code": SSO_GROUP_INVALID_ERROR_CODE,
-                },
-                USER_PRINCIPAL_TYPE_LABEL: {
-                    "resource_map": self.sso_users,
-                    "invalid_resource_names": self._invalid_manifest_file_rules,
-                    "resource_invalid_error_message": SSO_USER_INVALID_ERROR_MESSAGE,
-                    "resource_invalid_error_code": SSO_USER_INVALID_ERROR_CODE,
-                },
-                PERMISSION_SET_TYPE_LABEL: {
-                    "resource_map": self.sso_permission_sets,
-                    "invalid_resource_names": self._invalid_manifest_file_rules,
-                    "resource_invalid_error_message": PERMISSION_SET_INVALID_ERROR_MESSAGE,
-                    "resource_invalid_error_code": PERMISSION_SET_INVALID_ERROR_CODE,
-                },
-            }
+                str: The validated resource ID.
 
-            resource_map = resource_maps[resource_type].get("resource_map", {})
-            invalid_resource_names = resource_maps[resource_type].get(
-                "invalid_resource_names", []
-            )
-            resource_invalid_error_code = resource_maps[resource_type].get(
-                "resource_invalid_error_code", "NA"
-            )
-            resource_invalid_error_message = resource_maps[resource_type].get(
-                "resource_invalid_error_message", "NA"
-            )
+            Raises:
+                SSOPrincipalNotFoundError: If a group or user does not exist.
+                AWSAccountOrOrgNotFoundError: If an OU or account does not exist.
+                PermissionSetNotFoundError: If a permission set does not exist.
+            """
+            (
+                resource_map,
+                resource_invalid_error_code,
+                resource_invalid_error_message,
+                resource_not_found_error,
+            ) = resource_maps[resource_type]
             if resource_name not in resource_map:
-                invalid_rule = InvalidAssignmentRule(
-                    rule_number=rule_number,
-                    resource_type=resource_type,
-                    resource_name=resource_name,
-                    resource_invalid_error_message=resource_invalid_error_message,
-                    resource_invalid_error_code=resource_invalid_error_code,
-                )
-                invalid_resource_names.append(invalid_rule)
-
-                # Raise error
-                # pylint: disable=R1720
-                if resource_type in (
-                    GROUP_PRINCIPAL_TYPE_LABEL,
-                    USER_PRINCIPAL_TYPE_LABEL,
-                ):
-                    raise SSOPrincipalNotFoundError(
-                        resource_invalid_error_message, resource_invalid_error_code
-                    )
-                elif resource_type in (OU_TARGET_TYPE_LABEL, ACCOUNT_TARGET_TYPE_LABEL):
-                    raise AWSAccountOrOrgNotFoundError(
-                        resource_invalid_error_message, resource_invalid_error_code
-                    )
-                else:
-                    raise PermissionSetNotFoundError(
-                        resource_invalid_error_message, resource_invalid_error_code
+                self._invalid_manifest_file_rules.append(
+                    InvalidAssignmentRule(
+                        rule_number=rule_number,
+                        resource_type=resource_type,
+                        resource_name=resource_name,
+                        resource_invalid_error_message=resource_invalid_error_message,
+                        resource_invalid_error_code=resource_invalid_error_code,
                     )
+                )
+                raise resource_not_found_error(
+                    resource_invalid_error_message, resource_invalid_error_code
+                )
 
             return resource_map[resource_name]
 
+        local_assignment_keys: set[tuple[str, str, str, str]] = set()
+
+        # Flatten each OU's accounts to their IDs once, so rules targeting the
+        # same OU reuse the tuple instead of re-reading every account record
+        ou_account_ids_map: dict[str, tuple[str, ...]] = {
+            ou_name: tuple(account["Id"] for account in ou_accounts)
+            for ou_name, ou_accounts in self.ou_accounts_map.items()
+        }
+
         def add_unique_assignment(
-            target_id: int,
+            target_id: str,
             principal_id: str,
             principal_type: str,
             permission_set_arn: str,
@@ -442,34 +632,45 @@ class IdentityCenterManager:
             """
             Adds a unique assignment to the list of resolved account assignments.
 
+            Assignments already resolved by an earlier rule or target are
+            detected with a set lookup before any assignment is built.
+
             Args:
-                target_id (int): The target account ID for the assignment.
+                target_id (str): The target account ID for the assignment.
                 principal_id (str): The ID of the principal (user or group).
                 principal_type (str): The type of principal (USER or GROUP).
                 permission_set_arn (str): The ARN of the permission set to assign.
             """
-
-            assignment = AccountAssignment(
-                TargetId=target_id,
-                PrincipalId=principal_id,
-                PrincipalType=principal_type,
-                PermissionSetArn=permission_set_arn,
-                InstanceArn=self._identity_store_arn,
+            assignment_key = (
+                target_id,
+                principal_id,
+                principal_type,
+                permission_set_arn,
             )
+            if assignment_key in local_assignment_keys:
+                return
 
-            if assignment not in self._local_account_assignments:
-                self._local_account_assignments.append(assignment)
+            local_assignment_keys.add(assignment_key)
+            self._local_account_assignments.append(
+                AccountAssignment(
+                    TargetId=target_id,
+                    PrincipalId=principal_id,
+                    PrincipalType=principal_type,
+                    PermissionSetArn=permission_set_arn,
+                    InstanceArn=self._identity_store_arn,
+                )
+            )
 
-        for i, rule in enumerate(self.manifest_file_rbac_rules):
-            self._logger.info(rule)
-            rule["rule_number"] = i
+        for rule_number, rule in enumerate(self.manifest_file_rbac_rules):
+            self._logger.debug("Resolving manifest file rule %d: %s", rule_number, rule)
+            principal_type = sys.intern(rule["principal_type"])
             try:
                 # Validate principal and permission set provided are valid and exist
-                rule["principal_id"] = validate_aws_resource(
-                    rule["rule_number"], rule["principal_name"], rule["principal_type"]
+                principal_id = validate_aws_resource(
+                    rule_number, rule["principal_name"], principal_type
                 )
-                rule["permission_set_arn"] = validate_aws_resource(
-                    rule["rule_number"],
+                permission_set_arn = validate_aws_resource(
+                    rule_number,
                     rule["permission_set_name"],
                     PERMISSION_SET_TYPE_LABEL,
                 )
@@ -477,53 +678,56 @@ class IdentityCenterManager:
                 self._logger.error(
                     "Error: %s (manifest file rule: %s). Continuing to next rule.",
                     str(e),
-                    rule["rule_number"],
+                    rule_number,
                 )
                 continue
 
+            target_type = rule["target_type"]
             for name in rule["target_names"]:
                 try:
                     # Validate AWS OU/Account target
-                    validate_aws_resource(
-                        rule["rule_number"], name, rule["target_type"]
-                    )
+                    validate_aws_resource(rule_number, name, target_type)
                 except AWSAccountOrOrgNotFoundError as e:
                     self._logger.error(
                         "Error: %s (manifest file rule: %s). Continuing to next rule.",
                         str(e),
-                        rule["rule_number"],
+                        rule_number,
                     )
                     continue
 
-                if rule["target_type"] == OU_TARGET_TYPE_LABEL:
-                    for child_ou_account in self.ou_accounts_map[name]:
+                if target_type == OU_TARGET_TYPE_LABEL:
+                    for account_id in ou_account_ids_map[name]:
                         add_unique_assignment(
-                            child_ou_account["Id"],
-                            rule["principal_id"],
-                            rule["principal_type"],
-                            rule["permission_set_arn"],
+                            account_id,
+                            principal_id,
+                            principal_type,
+                            permission_set_arn,
                         )
                 else:
                     account_id = self.account_name_id_map[name]
                     add_unique_assignment(
                         account_id,
-                        rule["principal_id"],
-                        rule["principal_type"],
-                        rule["permission_set_arn"],
+                        principal_id,
+                        principal_type,
+                        permission_set_arn,
                     )
 
+        # Assignments are frozen dataclasses, so they hash by value and the
+        # diff below is a hashed lookup per assignment rather than a list scan
         self._logger.info("Creating itinerary of SSO account assignments to create")
+        current_account_assignments = frozenset(self._current_account_assignments)
         self._assignments_to_create = list(
             itertools.filterfalse(
-                lambda i: i in self._current_account_assignments,
+                current_account_assignments.__contains__,
                 self._local_account_assignments,
             )
         )
 
         self._logger.warning("Creating itinerary of SSO account assignments to delete")
+        local_account_assignments = frozenset(self._local_account_assignments)
         self._assignments_to_delete = list(
             itertools.filterfalse(
-                lambda i: i in self._local_account_assignments,
+                local_account_assignments.__contains__,
                 self._current_account_assignments,
             )
         )
@@ -649,11 +853,11 @@ class IdentityCenterManager:
         if self.is_auto_approved:
             self._logger.warning("Running in auto-approved mode")
             self._logger.info("Executing create itinerary of SSO account assignments")
-            for assignment in track(
-                sequence=self._assignments_to_create,
-                description="Creating account assignments",
-            ):
-                self._sso_admin_client.create_account_assignment(**assignment.to_dict())
+            self._run_account_assignment_operations(
+                self._create_account_assignment,
+                self._assignments_to_create,
+                "Creating account assignments",
+            )
 
         self._logger.info("Generating DELETE changeset for SSO account assignments")
         create_assignments_change_set(
@@ -662,8 +866,11 @@ class IdentityCenterManager:
         if self.is_auto_approved:
             self._logger.warning("Running in auto-approved mode")
             self._logger.warning("Creating delete itinerary of SSO account assignments")
-            for assignment in track(self._assignments_to_delete):
-                self._sso_admin_client.delete_account_assignment(**assignment.to_dict())
+            self._run_account_assignment_operations(
+                self._delete_account_assignment,
+                self._assignments_to_delete,
+                "Deleting account assignments",
+            )
 
         if self._invalid_manifest_file_rules:
             self._logger.warning(
@@ -673,6 +880,70 @@ class IdentityCenterManager:
                 invalid_rules=self._invalid_manifest_file_rules
             )
 
+    def _run_account_assignment_operations(
+        self,
+        operation: Callable[[AccountAssignment], None],
+        sso_assignments: list[AccountAssignment],
+        description: str,
+    ) -> None:
+        """
+        Applies an account assignment operation to each assignment concurrently.
+
+        Each assignment targets a distinct (account, principal, permission set)
+        combination, so the calls are independent. They are bounded by
+        MAX_CONCURRENT_ASSIGNMENT_OPERATIONS and progress is tracked as they
+        complete.
+
+        Args:
+            operation (Callable[[AccountAssignment], None]): The create or delete
+                operation to apply to a single assignment.
+            sso_assignments (list[AccountAssignment]): The assignments to apply
+                the operation to.
+            description (str): Description shown next to the progress bar.
+
+        Raises:
+            Exception: The first error raised by any of the operations. The
+                operations that have not started yet are cancelled, and the
+                error is raised once the running ones have finished.
+        """
+        with ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_ASSIGNMENT_OPERATIONS
+        ) as executor:
+            futures = [
+                executor.submit(operation, assignment) for assignment in sso_assignments
+            ]
+            try:
+                for future in track(
+                    sequence=as_completed(futures),
+                    total=len(futures),
+                    description=description,
+                ):
+                    future.result()
+            except BaseException:
+                # Stop applying the remaining changes once any of them fails
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+    @handle_aws_exceptions()
+    def _create_account_assignment(self, assignment: AccountAssignment) -> None:
+        """
+        Creates a single account assignment.
+
+        Args:
+            assignment (AccountAssignment): The account assignment to create.
+        """
+        self._sso_admin_client.create_account_assignment(**assignment.to_dict())
+
+    @handle_aws_exceptions()
+    def _delete_account_assignment(self, assignment: AccountAssignment) -> None:
+        """
+        Deletes a single account assignment.
+
+        Args:
+            assignment (AccountAssignment): The account assignment to delete.
+        """
+        self._sso_admin_client.delete_account_assignment(**assignment.to_dict())
+
     def run_access_control_resolver(self) -> None:
         """
         Runs the full access control resolver process.
@@ -10,17 +10,22 @@ The module defines the following main components:
     - OuAccountsObject: Type alias for account list structures
 
 Key Features:
-    - Recursive traversal of AWS Organization hierarchy
+    - Concurrent traversal of AWS Organization hierarchy
     - Retrieval of active accounts per organizational unit
     - Creation of name-to-ID mapping for accounts
     - Automatic filtering of inactive accounts
     - Pagination handling for large organizations
+    - Optional in-process reuse of recent OU listings across manager instances
+    - Optional on-disk caching of the organization map
     - Comprehensive error handling
 
 Example:
     # Initialize the manager (auto-discovers root OU ID)
     org_manager = AwsOrganizationsManager()
 
+    # Or skip root discovery when the root OU ID is already known
+    org_manager = AwsOrganizationsManager(root_ou_id="r-ab12")
+
     # Access the full OU to accounts mapping
     ou_accounts = org_manager.ou_accounts_map
 
@@ -33,26 +38,34 @@ Note:
     - organizations:ListRoots
     - organizations:ListAccountsForParent
     - organizations:ListOrganizationalUnitsForParent
-    - organizations:DescribeOrganizationalUnit
 """
 
 import logging
 from typing import TypeAlias, Literal
 from dataclasses import dataclass, field
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 
-import boto3
 from mypy_boto3_organizations import OrganizationsClient
 from mypy_boto3_organizations.paginator import (
     ListAccountsForParentPaginator,
     ListOrganizationalUnitsForParentPaginator,
 )
+from src.core.utils import read_cache, write_cache
 from src.core.custom_classes import SubscriptableDataclass
-from src.core.constants import SSO_ENTITLMENTS_APP_NAME
-from src.services.aws.utils import handle_aws_exceptions
+from src.core.constants import (
+    SSO_ENTITLMENTS_APP_NAME,
+    MAX_CONCURRENT_AWS_REQUESTS,
+    ORGANIZATIONS_MAX_PAGE_SIZE,
+)
+from src.services.aws.utils import (
+    get_aws_client,
+    cache_aws_read,
+    handle_aws_exceptions,
+)
 
 
 # Data Classes
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class AwsAccount(SubscriptableDataclass):
     """Represents an AWS Account"""
 
@@ -67,6 +80,10 @@ class AwsAccount(SubscriptableDataclass):
 # Type hints
 OuAccountsObject: TypeAlias = list[AwsAccount]
 
+# Define constants
+ACTIVE_ACCOUNTS_EXPRESSION = "Accounts[?Status=='ACTIVE']"
+ORGANIZATION_MAP_CACHE_PREFIX = "organization_map"
+
 
 class AwsOrganizationsManager:
     """
@@ -79,13 +96,14 @@ class AwsOrganizationsManager:
     Attributes:
         _ou_accounts_map (dict): A nested mapping of organizational unit names to their accounts.
         _account_name_id_map (dict): A mapping of account names to their unique AWS account IDs.
+        _ou_name_id_map (dict): A mapping of organizational unit names to their OU IDs.
         _logger (logging.Logger): Logger for tracking organization mapping process.
 
     Properties:
         ou_accounts_map (dict[str, OuAccountsObject]):
             A dictionary where keys are Organizational Unit names and values are
-            lists of active accounts. Each account is represented as a dictionary
-            with 'Id' and 'Name' keys.
+            lists of active accounts. Each account is represented as an AwsAccount
+            that supports subscript access to its 'Id' and 'Name' keys.
 
             Example:
                 {
@@ -107,25 +125,44 @@ class AwsOrganizationsManager:
                     'Development Account': '210987654321',
                     'Network Account': '345678901234'
                 }
+
+        ou_name_id_map (dict[str, str]):
+            A dictionary mapping organizational unit names to their OU IDs.
+            The root OU is keyed as 'root'.
+
+            Example:
+                {
+                    'root': 'r-ab12',
+                    'Infrastructure': 'ou-ab12-34cd56ef'
+                }
     """
 
-    def __init__(self) -> None:
+    def __init__(self, root_ou_id: str | None = None) -> None:
         """
         Initialize the AWS Organizations manager and generate the organization map.
 
-        The root OU ID is automatically discovered from AWS Organizations.
+        Args:
+            root_ou_id (str | None, optional): The organization's root OU ID.
+                Defaults to None, in which case it is auto-discovered from
+                AWS Organizations. Root IDs are stable for the lifetime of an
+                organization, so callers that already know it save a request.
 
         Note:
             This method automatically initiates the organization mapping process
-            during instantiation. AWS resources are auto-discovered.
+            during instantiation. AWS resources are auto-discovered. When
+            SSO_MANAGER_CACHE_TTL_SECONDS is set, a fresh cached map for the
+            same root OU is loaded instead of walking the organization.
         """
-        self._ou_accounts_map: dict[str, AwsAccount] = {}
+        self._ou_accounts_map: dict[str, OuAccountsObject] = {}
         self._account_name_id_map: dict[str, str] = {}
+        self._ou_name_id_map: dict[str, str] = {}
         self._logger: logging.Logger = logging.getLogger(SSO_ENTITLMENTS_APP_NAME)
 
         # Initialize AWS clients
-        self._organizations_client: OrganizationsClient = boto3.client("organizations")
-        self._accounts_pagniator: ListAccountsForParentPaginator = (
+        self._organizations_client: OrganizationsClient = get_aws_client(
+            "organizations"
+        )
+        self._accounts_paginator: ListAccountsForParentPaginator = (
             self._organizations_client.get_paginator("list_accounts_for_parent")
         )
         self._ous_paginator: ListOrganizationalUnitsForParentPaginator = (
@@ -134,55 +171,181 @@ class AwsOrganizationsManager:
             )
         )
 
-        # Auto-discover root OU ID
-        self._logger.info("Auto-discovering root OU ID...")
-        response = self._organizations_client.list_roots()
-        self._root_ou_id = response["Roots"][0]["Id"]
-        self._logger.info("Discovered root OU ID: %s", self._root_ou_id)
+        # Auto-discover root OU ID unless provided
+        if root_ou_id:
+            self._root_ou_id = root_ou_id
+        else:
+            self._logger.info("Auto-discovering root OU ID...")
+            self._root_ou_id = self._discover_root_ou_id()
+            self._logger.info("Discovered root OU ID: %s", self._root_ou_id)
+
+        cache_name = f"{ORGANIZATION_MAP_CACHE_PREFIX}.{self._root_ou_id}"
+        if self._load_cached_organization_map(cache_name):
+            self._logger.info("Loaded AWS organization map from cache")
+            return
 
         self._logger.info("Mapping AWS organization")
         self._generate_aws_organization_map(self._root_ou_id)
+        write_cache(
+            cache_name,
+            {
+                "ou_accounts_map": {
+                    ou_name: [account.to_dict() for account in ou_accounts]
+                    for ou_name, ou_accounts in self._ou_accounts_map.items()
+                },
+                "account_name_id_map": self._account_name_id_map,
+                "ou_name_id_map": self._ou_name_id_map,
+            },
+        )
 
     @handle_aws_exceptions()
+    def _discover_root_ou_id(self) -> str:
+        """
+        Look up the ID of the organization's root OU.
+
+        Returns:
+            str: The root OU ID.
+        """
+        response = self._organizations_client.list_roots()
+        return response["Roots"][0]["Id"]
+
+    def _load_cached_organization_map(self, cache_name: str) -> bool:
+        """
+        Populate the organization maps from a fresh on-disk cache entry.
+
+        Args:
+            cache_name (str): Name of the cache entry for this organization.
+
+        Returns:
+            bool: True if the maps were loaded from the cache, False if the
+            cache is disabled, missing, expired or malformed.
+        """
+        cached_map = read_cache(cache_name)
+        if not cached_map:
+            return False
+
+        try:
+            ou_accounts_map = {
+                ou_name: [AwsAccount(**account) for account in ou_accounts]
+                for ou_name, ou_accounts in cached_map["ou_accounts_map"].items()
+            }
+            account_name_id_map = dict(cached_map["account_name_id_map"])
+            ou_name_id_map = dict(cached_map["ou_name_id_map"])
+        except (KeyError, TypeError, ValueError):
+            return False
+
+        self._ou_accounts_map = ou_accounts_map
+        self._account_name_id_map = account_name_id_map
+        self._ou_name_id_map = ou_name_id_map
+        return True
+
     def _generate_aws_organization_map(self, ou_id: str) -> None:
         """
-        Recursively generate a comprehensive map of the AWS organization structure.
+        Generate a comprehensive map of the AWS organization structure.
 
-        This method traverses the organizational hierarchy, collecting information
-        about organizational units and their associated accounts.
+        This method walks the organizational hierarchy concurrently. For every
+        discovered OU, listing its accounts and listing its child OUs are
+        submitted as independent tasks, so sibling OUs are fetched in parallel
+        and the discovery of deeper OUs never waits behind an OU's account
+        pages. Workers only return their results, which are merged here on
+        the calling thread, so the shared maps are never written to concurrently.
 
         Args:
-            ou_id (str): The Organizational Unit ID to map.
+            ou_id (str): The Organizational Unit ID to start mapping from.
 
         Note:
             - Populates _ou_accounts_map with active accounts for each OU
             - Populates _account_name_id_map with unique account identifiers
-            - Recursively processes child organizational units
+            - Populates _ou_name_id_map as each OU is discovered
+            - Each OU ID is mapped at most once, so the walk always terminates
+            - Concurrency is bounded by MAX_CONCURRENT_AWS_REQUESTS
         """
-        # Get ou name
-        if ou_id != self._root_ou_id:
-            ou_details = self._organizations_client.describe_organizational_unit(
-                OrganizationalUnitId=ou_id
-            )
-            ou_name = ou_details["OrganizationalUnit"]["Name"]
-        else:
-            ou_name = "root"
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_AWS_REQUESTS) as executor:
+            ous_to_map: list[tuple[str, str]] = [(ou_id, "root")]
+            visited_ou_ids: set[str] = set()
+            account_futures: dict[Future, str] = {}
+            child_ou_futures: set[Future] = set()
+
+            while ous_to_map or account_futures or child_ou_futures:
+                for next_ou_id, next_ou_name in ous_to_map:
+                    if next_ou_id in visited_ou_ids:
+                        continue
+                    visited_ou_ids.add(next_ou_id)
+                    self._ou_name_id_map[next_ou_name] = next_ou_id
+                    account_futures[
+                        executor.submit(self._map_aws_ou_accounts, next_ou_id)
+                    ] = next_ou_name
+                    child_ou_futures.add(
+                        executor.submit(self._list_aws_child_ous, next_ou_id)
+                    )
+                ous_to_map = []
+
+                done, _ = wait(
+                    account_futures.keys() | child_ou_futures,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    if future in child_ou_futures:
+                        child_ou_futures.remove(future)
+                        ous_to_map.extend(future.result())
+                    else:
+                        ou_name = account_futures.pop(future)
+                        ou_accounts = future.result()
+                        self._ou_accounts_map[ou_name] = ou_accounts
+                        for account in ou_accounts:
+                            self._account_name_id_map[account.Name] = account.Id
+
+    @cache_aws_read("_organizations_client")
+    @handle_aws_exceptions()
+    def _map_aws_ou_accounts(self, ou_id: str) -> OuAccountsObject:
+        """
+        Map the active accounts directly under a single organizational unit.
+
+        Inactive accounts are filtered out by a JMESPath expression applied
+        to each page, so only active accounts are turned into AwsAccount records.
+
+        Args:
+            ou_id (str): The Organizational Unit ID to map.
 
-        # Add ou entry to ou_accounts map
-        self._ou_accounts_map[ou_name] = []
+        Returns:
+            OuAccountsObject: The active accounts directly under the OU.
+        """
+        ou_accounts: OuAccountsObject = []
+        active_accounts = self._accounts_paginator.paginate(
+            ParentId=ou_id,
+            PaginationConfig={"PageSize": ORGANIZATIONS_MAX_PAGE_SIZE},
+        ).search(ACTIVE_ACCOUNTS_EXPRESSION)
+        ou_accounts.extend(
+            AwsAccount(Id=account["Id"], Name=account["Name"])
+            for account in active_accounts
+        )
 
-        # Get accounts under OU
-        for page in self._accounts_pagniator.paginate(ParentId=ou_id):
-            for account in page.get("Accounts", []):
-                if account["Status"] == "ACTIVE":
-                    account = AwsAccount(Id=account["Id"], Name=account["Name"])
-                    self._ou_accounts_map[ou_name].append(account)
-                self._account_name_id_map[account["Name"]] = account["Id"]
+        return ou_accounts
 
-        # Recursively populate ou account map
-        for page in self._ous_paginator.paginate(ParentId=ou_id):
-            for child_ou in page.get("OrganizationalUnits", []):
-                self._generate_aws_organization_map(child_ou["Id"])
+    @cache_aws_read("_organizations_client")
+    @handle_aws_exceptions()
+    def _list_aws_child_ous(self, ou_id: str) -> list[tuple[str, str]]:
+        """
+        List the organizational units directly under an OU.
+
+        The OU names come back in the same response as the IDs, so no
+        per-OU describe call is needed to label the accounts map.
+
+        Args:
+            ou_id (str): The parent Organizational Unit ID.
+
+        Returns:
+            list[tuple[str, str]]: The (ID, name) pairs of the OU's child
+            organizational units.
+        """
+        return [
+            (child_ou["Id"], child_ou["Name"])
+            for page in self._ous_paginator.paginate(
+                ParentId=ou_id,
+                PaginationConfig={"PageSize": ORGANIZATIONS_MAX_PAGE_SIZE},
+            )
+            for child_ou in page.get("OrganizationalUnits", [])
+        ]
 
     @property
     def ou_accounts_map(self) -> dict[str, OuAccountsObject]:
@@ -191,7 +354,7 @@ class AwsOrganizationsManager:
 
         Returns:
             dict[str, OuAccountsObject]: A dictionary where keys are OU names
-            and values are lists of account dictionaries.
+            and values are lists of AwsAccount objects.
         """
         return self._ou_accounts_map
 
@@ -204,3 +367,13 @@ class AwsOrganizationsManager:
             dict[str, str]: A dictionary mapping account names to their unique IDs.
         """
         return self._account_name_id_map
+
+    @property
+    def ou_name_id_map(self) -> dict[str, str]:
+        """
+        Retrieves the mapping of Organizational Unit names to their OU IDs.
+
+        Returns:
+            dict[str, str]: A dictionary mapping OU names to their unique IDs.
+        """
+        return self._ou_name_id_map
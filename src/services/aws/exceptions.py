@@ -8,6 +8,8 @@ error messages when dealing with SSO permissions and principals.
 Exceptions:
     PermissionSetNotFoundError: Raised when permission sets are missing
     SSOPrincipalNotFoundError: Raised when SSO users/groups are missing
+    AWSAccountOrOrgNotFoundError: Raised when target accounts/OUs are missing
+    CircuitOpenError: Raised when a call is short-circuited during sustained throttling
 
 Example:
     try:
@@ -106,3 +108,19 @@ class AWSAccountOrOrgNotFoundError(Exception):
     ):
         self.error_type = error_type
         super().__init__(message)
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised when an AWS call is skipped because its circuit breaker is open.
+
+    This exception indicates that the decorated method recently failed with
+    retryable errors (throttling or internal service errors) enough times in a
+    row that further attempts are refused until the cooldown elapses, instead
+    of adding load to a service that is already rejecting requests.
+
+    Example:
+        raise CircuitOpenError(
+            "Circuit open for _create_account_assignment, retry in 30.0 seconds"
+        )
+    """
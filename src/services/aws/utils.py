@@ -7,63 +7,545 @@ strategies with exponential backoff and comprehensive exception logging.
 
 Key Features:
     - Automatic retry for transient AWS service exceptions
-    - Exponential backoff between retry attempts
+    - Exponential backoff with jitter between retry attempts
     - Detailed logging of errors and retry attempts
     - Configurable retry parameters
+    - Non-blocking retries for async def methods
+    - Per-method circuit breaker that fails fast during sustained throttling
+    - Client-side token-bucket rate limiting of every request per AWS service
+    - Opt-in in-process TTL cache for idempotent AWS reads, filled single-flight
     - Specialized handling for AWS Organizations and SSO Admin exceptions
+    - Shared botocore client configuration, leaving retries to the decorator
+    - Process-wide cache of boto3 clients built from a single session
 """
 
+import asyncio
+import inspect
 import logging
 import functools
-import time
 import os
-from typing import Callable, Any
+import random
+import collections
+import copy
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, Any, Literal
 
 import boto3
+from botocore.client import BaseClient
+from botocore.config import Config
+from botocore.exceptions import ConnectionError as BotocoreConnectionError
+from botocore.exceptions import HTTPClientError
 from src.core.constants import (
     SSO_ENTITLMENTS_APP_NAME,
     MAX_RETRIES,
     RETRY_DELAY_SECONDS,
+    RETRY_BUDGET_SECONDS,
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+    AWS_MAX_POOL_CONNECTIONS,
+    AWS_CLIENT_MAX_ATTEMPTS,
+    AWS_CLIENT_RETRY_MODE,
+    ORGANIZATIONS_REQUESTS_PER_SECOND,
+    IDENTITY_CENTER_REQUESTS_PER_SECOND,
+    AWS_REQUESTS_PER_SECOND_ENV_VAR,
+    AWS_READ_CACHE_MAX_ENTRIES,
 )
+from src.core.utils import get_cache_ttl_seconds
+from src.services.aws.exceptions import CircuitOpenError
 
 # Define constants
 LOGGER = logging.getLogger(SSO_ENTITLMENTS_APP_NAME)
-AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
-SSO_ADMIN_CLIENT = boto3.client("sso-admin", region_name=AWS_REGION)
-AWS_ORGANIZATIONS_CLIENT = boto3.client("organizations", region_name=AWS_REGION)
+AWS_CLIENT_CONFIG = Config(
+    max_pool_connections=AWS_MAX_POOL_CONNECTIONS,
+    retries={
+        "mode": AWS_CLIENT_RETRY_MODE,
+        "total_max_attempts": AWS_CLIENT_MAX_ATTEMPTS,
+    },
+    tcp_keepalive=True,
+)
+BOTO3_SESSION = boto3.Session()
+# OS entropy, so forked workers never share a jitter stream
+RETRY_JITTER_RANDOM = random.SystemRandom()
+AWS_SERVICE_REQUESTS_PER_SECOND = {
+    "organizations": ORGANIZATIONS_REQUESTS_PER_SECOND,
+    "sso-admin": IDENTITY_CENTER_REQUESTS_PER_SECOND,
+    "identitystore": IDENTITY_CENTER_REQUESTS_PER_SECOND,
+}
+
+
+# Define classes
+@dataclass(slots=True)
+class CircuitBreakerState:
+    """
+    Tracks consecutive failed calls of one decorated method.
+
+    Only calls that give up on a throttling, server-side or connection error
+    are counted, once per call however many attempts it made. The circuit
+    is closed while opened_at is 0.0. Once failures reaches the
+    threshold it opens, and calls fail fast until the cooldown elapses. The
+    circuit is then half-open: exactly one call is let through as a probe
+    while every other call keeps failing fast. A successful probe closes the
+    circuit, and a probe failing with a counted error reopens it for a
+    fresh cooldown. A probe that never reports back, e.g. because it was
+    cancelled, gives up its slot after another cooldown.
+
+    Attributes:
+        failures (int): Consecutive counted failures since the last success.
+        opened_at (float): time.monotonic() reading when the circuit opened.
+        probe_started_at (float): time.monotonic() reading when the half-open
+            probe was let through, or 0.0 while no probe is in flight.
+        lock (threading.Lock): Guards the state across worker threads.
+    """
+
+    failures: int = 0
+    opened_at: float = 0.0
+    probe_started_at: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def check(self, name: str, cooldown_seconds: float) -> bool:
+        """
+        Raises CircuitOpenError unless the circuit lets the call through.
+
+        Args:
+            name (str): Name of the decorated method, used in the error message.
+            cooldown_seconds (float): How long an open circuit fails fast.
+
+        Returns:
+            bool: True if the call is the half-open probe, False if the
+            circuit is closed.
+
+        Raises:
+            CircuitOpenError: If the cooldown has not elapsed yet, or another
+                call is already probing the half-open circuit.
+        """
+        with self.lock:
+            if not self.opened_at:
+                return False
+            now = time.monotonic()
+            remaining_seconds = cooldown_seconds - (now - self.opened_at)
+            if remaining_seconds <= 0 and (
+                not self.probe_started_at
+                or now - self.probe_started_at >= cooldown_seconds
+            ):
+                self.probe_started_at = now
+                return True
+        if remaining_seconds > 0:
+            raise CircuitOpenError(
+                f"Circuit open for {name}, retry in {remaining_seconds:.1f} seconds"
+            )
+        raise CircuitOpenError(f"Circuit half-open for {name}, probe in flight")
+
+    def record_success(self) -> None:
+        """Closes the circuit and clears the failure count."""
+        with self.lock:
+            self.failures = 0
+            self.opened_at = 0.0
+            self.probe_started_at = 0.0
+
+    def record_failure(
+        self, threshold: int, is_probe: bool, is_service_failure: bool = True
+    ) -> None:
+        """
+        Counts a failed call, opening the circuit once threshold is reached.
+
+        Failures of calls that started before the circuit opened are counted
+        but never move opened_at, so only a failed probe restarts the cooldown.
+        Other failures, such as conflicts or invalid requests, are not counted,
+        except that one answering the probe closes the circuit, as the service
+        is responding again.
+
+        Args:
+            threshold (int): Consecutive failed calls that open the circuit.
+            is_probe (bool): Whether the failed call was the half-open probe.
+            is_service_failure (bool, optional): Whether the call failed on a
+                throttling, server-side or connection error. Defaults to True.
+        """
+        if not is_service_failure:
+            if is_probe:
+                self.record_success()
+            return
+        with self.lock:
+            self.failures += 1
+            if is_probe:
+                self.probe_started_at = 0.0
+                self.opened_at = time.monotonic()
+            elif not self.opened_at and self.failures >= threshold:
+                self.opened_at = time.monotonic()
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket that paces calls to an AWS service.
+
+    Tokens refill continuously at rate per second up to capacity. Callers
+    reserve a token and are told how long to wait for it, so the bucket can be
+    drained by both blocking threads and coroutines without holding its lock
+    while they wait.
+
+    Attributes:
+        rate (float): Tokens added per second.
+        capacity (float): Maximum tokens held, i.e. the allowed burst size.
+        tokens (float): Tokens currently available; negative while callers
+            are waiting on reserved tokens.
+        timestamp (float): time.monotonic() reading of the last refill.
+        lock (threading.Lock): Guards the bucket across worker threads.
+    """
+
+    __slots__ = ("rate", "capacity", "tokens", "timestamp", "lock")
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.tokens = self.capacity
+        self.timestamp = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Takes tokens from the bucket, going into debt if it is empty.
+
+        Args:
+            tokens (float, optional): Number of tokens to take. Defaults to 1.
+
+        Returns:
+            float: Seconds the caller must wait before making its call.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.timestamp) * self.rate
+            )
+            self.timestamp = now
+            self.tokens -= tokens
+            return max(0.0, -self.tokens / self.rate)
+
+    def acquire(self, tokens: float = 1) -> None:
+        """
+        Blocks the calling thread until the reserved tokens are available.
+
+        Args:
+            tokens (float, optional): Number of tokens to take. Defaults to 1.
+        """
+        wait_time = self.reserve(tokens)
+        if wait_time:
+            time.sleep(wait_time)
+
+
+class RetryableExceptionMatcher:
+    """
+    Decides whether an exception raised by a decorated call should be retried.
+
+    Exceptions are matched by an exact-type set lookup first, since the
+    retryable AWS exceptions are leaf classes, with an isinstance check only
+    as the fallback for subclasses. The default AWS exceptions are resolved
+    on first use so that decorating a method builds no boto3 client.
+
+    Attributes:
+        exceptions (tuple[type[Exception], ...] | None): The retryable exception
+            classes, or None until the defaults are resolved.
+        types (frozenset[type[Exception]] | None): The same classes as a set.
+        get_defaults (Callable[[], tuple[type[Exception], ...]]): Resolves the
+            default exception classes when none are given.
+    """
+
+    __slots__ = ("exceptions", "types", "get_defaults")
+
+    def __init__(
+        self,
+        exceptions: tuple[type[Exception], ...] | None,
+        get_defaults: Callable[[], tuple[type[Exception], ...]] | None = None,
+    ) -> None:
+        self.exceptions = exceptions
+        self.types = frozenset(exceptions) if exceptions is not None else None
+        self.get_defaults = get_defaults or get_retryable_aws_exceptions
+
+    def __call__(self, error: Exception) -> bool:
+        """
+        Checks error against the retryable exception classes.
+
+        Args:
+            error (Exception): The exception raised by the decorated call.
+
+        Returns:
+            bool: True if the call should be retried.
+        """
+        if self.types is None:
+            self.exceptions = self.get_defaults()
+            self.types = frozenset(self.exceptions)
+        return type(error) in self.types or isinstance(error, self.exceptions)
 
 
 # Define functions
+@functools.cache
+def get_token_bucket(service_name: str) -> TokenBucket | None:
+    """
+    Returns the token bucket shared by every request to an AWS service.
+
+    The rate comes from AWS_SERVICE_REQUESTS_PER_SECOND unless the
+    SSO_MANAGER_AWS_REQUESTS_PER_SECOND environment variable overrides it,
+    e.g. to lift the limit against a mocked AWS backend. The environment is
+    read once per service, when its bucket is first requested.
+
+    Args:
+        service_name (str): The AWS service name, e.g. "sso-admin".
+
+    Returns:
+        TokenBucket | None: A bucket refilling at the service's rate, or None
+        when the override is 0 and client-side rate limiting is disabled.
+    """
+    requests_per_second = AWS_SERVICE_REQUESTS_PER_SECOND[service_name]
+    try:
+        requests_per_second = max(
+            float(os.environ.get(AWS_REQUESTS_PER_SECOND_ENV_VAR, requests_per_second)),
+            0.0,
+        )
+    except ValueError:
+        LOGGER.warning(
+            "Ignoring invalid %s, using %.1f requests per second",
+            AWS_REQUESTS_PER_SECOND_ENV_VAR,
+            requests_per_second,
+        )
+    return TokenBucket(requests_per_second) if requests_per_second else None
+
+
+@functools.cache
+def get_aws_client(service_name: str) -> BaseClient:
+    """
+    Returns a boto3 client for an AWS service, creating it on first use.
+
+    Building a client loads and parses the service model and resolves its
+    endpoint, so clients are created once per process from a shared session
+    and reused afterwards. Botocore clients are safe to share across threads.
+
+    Clients of the services in AWS_SERVICE_REQUESTS_PER_SECOND take a token
+    from the service's shared bucket before every API call, each paginator
+    page included, so the process stays under the service's request rate
+    instead of discovering it through ThrottlingExceptions.
+
+    Args:
+        service_name (str): The AWS service name, e.g. "organizations".
+
+    Returns:
+        BaseClient: A client configured with AWS_CLIENT_CONFIG.
+
+    Examples:
+        >>> organizations_client = get_aws_client("organizations")
+        >>> organizations_client is get_aws_client("organizations")
+        True
+    """
+    client = BOTO3_SESSION.client(service_name, config=AWS_CLIENT_CONFIG)
+    if service_name in AWS_SERVICE_REQUESTS_PER_SECOND and (
+        token_bucket := get_token_bucket(service_name)
+    ):
+
+        def pace_request(**_) -> None:
+            """Blocks until the service's bucket has a token for this request."""
+            token_bucket.acquire()
+
+        client.meta.events.register("before-call", pace_request)
+    return client
+
+
+@functools.cache
+def get_retryable_aws_exceptions() -> tuple[type[Exception], ...]:
+    """
+    Returns the AWS service exceptions that are retried by default.
+
+    botocore builds exception classes per session, so they are read from the
+    shared clients returned by get_aws_client; classes taken from any other
+    session would never match the errors those clients raise. The tuple is
+    built on first use rather than at import, so importing this module does
+    not construct any boto3 client.
+
+    The shared clients make a single attempt per call, so these also cover the
+    throttling, server-side and connection errors botocore would otherwise
+    retry itself.
+
+    Returns:
+        tuple[type[Exception], ...]: Transient SSO Admin, Identity Store and
+        AWS Organizations exception classes, and botocore connection errors.
+    """
+    return get_service_failure_aws_exceptions() + (
+        get_aws_client("sso-admin").exceptions.ConflictException,
+    )
+
+
+@functools.cache
+def get_service_failure_aws_exceptions() -> tuple[type[Exception], ...]:
+    """
+    Returns the AWS exceptions that show a service is throttling or failing.
+
+    These are the retryable exceptions that count toward a circuit breaker.
+    ConflictException is left out: it is routine while a permission set is
+    provisioned by concurrent assignment writes, and says nothing about the
+    health of the service.
+
+    Returns:
+        tuple[type[Exception], ...]: Throttling and server-side exception
+        classes of the shared clients, and botocore connection errors.
+    """
+    sso_admin_exceptions = get_aws_client("sso-admin").exceptions
+    identity_store_exceptions = get_aws_client("identitystore").exceptions
+    organizations_exceptions = get_aws_client("organizations").exceptions
+    return (
+        sso_admin_exceptions.InternalServerException,
+        sso_admin_exceptions.ThrottlingException,
+        identity_store_exceptions.InternalServerException,
+        identity_store_exceptions.ThrottlingException,
+        organizations_exceptions.ServiceException,
+        organizations_exceptions.TooManyRequestsException,
+        BotocoreConnectionError,
+        HTTPClientError,
+    )
+
+
+def _get_backoff_seconds(
+    attempt: int,
+    retry_delay_seconds: float,
+    cap_seconds: float,
+    jitter: Literal["full", "equal", "none"],
+) -> float:
+    """
+    Computes the delay before a retry attempt.
+
+    The exponential delay for the attempt is capped, then randomized so that
+    concurrent callers throttled at the same moment do not retry in lockstep.
+
+    Args:
+        attempt (int): The 1-based retry attempt number.
+        retry_delay_seconds (float): The base delay of the first retry.
+        cap_seconds (float): The upper bound of any single delay.
+        jitter (Literal["full", "equal", "none"]): "full" draws the delay
+            uniformly from zero to the capped exponential delay, "equal" keeps
+            half of it and randomizes the other half, and "none" uses it as-is.
+
+    Returns:
+        float: The number of seconds to wait before retrying.
+    """
+    exponential_delay = min(cap_seconds, retry_delay_seconds * (2 ** (attempt - 1)))
+    if jitter == "full":
+        return RETRY_JITTER_RANDOM.uniform(0, exponential_delay)
+    if jitter == "equal":
+        return exponential_delay / 2 + RETRY_JITTER_RANDOM.uniform(
+            0, exponential_delay / 2
+        )
+    return exponential_delay
+
+
+@functools.cache
+def get_aws_exception_log_messages() -> dict[type[Exception], str]:
+    """
+    Returns the log message for each non-retryable AWS exception with a known cause.
+
+    Like get_retryable_aws_exceptions(), the table is keyed on the exception
+    classes of the shared clients and built on first use.
+
+    Returns:
+        dict[type[Exception], str]: Log messages keyed on the exception class
+        they describe.
+    """
+    sso_admin_exceptions = get_aws_client("sso-admin").exceptions
+    organizations_exceptions = get_aws_client("organizations").exceptions
+    return {
+        # AWS Organizations related exceptions
+        organizations_exceptions.ParentNotFoundException: "Invalid parent OU name",
+        organizations_exceptions.AccessDeniedException: "Missing required IAM policy permissions",
+        # AWS SSO Admin related exceptions
+        sso_admin_exceptions.AccessDeniedException: "Missing required IAM policy permissions",
+        sso_admin_exceptions.ServiceQuotaExceededException: (
+            "Exceeded limit of allowed AWS account assignments, request service quota increase"
+        ),
+        sso_admin_exceptions.ResourceNotFoundException: "Invalid TargetID, PrincipalID, or PermissionSetArn",
+    }
+
+
+def _log_aws_exception(error: Exception) -> None:
+    """
+    Logs a non-retryable AWS service exception with a hint about its likely cause.
+
+    The message is found by a single lookup on the exception's type, falling
+    back to an isinstance scan only for subclasses of the known exceptions.
+    Exceptions without a known cause are left for the caller to report.
+    It must be called while the exception is being handled, as the error and
+    its traceback are attached by LOGGER.exception rather than formatted in.
+
+    Args:
+        error (Exception): The exception raised by the AWS service call.
+    """
+    log_messages = get_aws_exception_log_messages()
+    message = log_messages.get(type(error)) or next(
+        (
+            message
+            for exception_class, message in log_messages.items()
+            if isinstance(error, exception_class)
+        ),
+        None,
+    )
+    if message is not None:
+        # Logs the exception being handled, with its traceback
+        LOGGER.exception(message)
+
+
 def handle_aws_exceptions(
     max_retries: int = MAX_RETRIES,
     retry_delay_seconds: float = RETRY_DELAY_SECONDS,
-    retryable_exceptions: tuple = (
-        SSO_ADMIN_CLIENT.exceptions.InternalServerException,
-        SSO_ADMIN_CLIENT.exceptions.ConflictException,
-        SSO_ADMIN_CLIENT.exceptions.ThrottlingException,
-        AWS_ORGANIZATIONS_CLIENT.exceptions.ServiceException,
-        AWS_ORGANIZATIONS_CLIENT.exceptions.TooManyRequestsException,
-    ),
+    retryable_exceptions: tuple[type[Exception], ...] | None = None,
+    jitter: Literal["full", "equal", "none"] = "full",
+    cap_seconds: float | None = None,
+    retry_budget_seconds: float = RETRY_BUDGET_SECONDS,
+    threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    cooldown_seconds: float = CIRCUIT_BREAKER_COOLDOWN_SECONDS,
 ) -> Callable:
     """
     A decorator that provides robust exception handling and retry mechanism for AWS service calls.
 
     This decorator wraps methods to handle common AWS service exceptions, implementing
     an intelligent retry strategy with exponential backoff. It can handle transient
-    service errors, throttling, and other recoverable exceptions.
+    service errors, throttling, and other recoverable exceptions. Delays are
+    jittered by default so concurrent callers spread their retries out.
+
+    Each decorated method also gets a circuit breaker shared by all of its
+    callers: after threshold consecutive calls give up on a throttling,
+    server-side or connection error, calls raise CircuitOpenError immediately
+    until cooldown_seconds have passed, rather than spending the full retry
+    budget against a service that keeps throttling. A single probe call then
+    decides whether the circuit closes or reopens. The circuit is checked once
+    when a call starts, so a call already retrying is never cut short. When
+    retryable_exceptions is given, every one of them counts toward the circuit.
 
     Args:
         max_retries (int, optional): Maximum number of retry attempts before giving up.
             Defaults to MAX_RETRIES from constants.
         retry_delay_seconds (float, optional): Initial delay between retry attempts.
             The delay increases exponentially with each retry. Defaults to RETRY_DELAY_SECONDS.
-        retryable_exceptions (tuple, optional): A tuple of exception types that trigger
-            a retry attempt. Defaults to common AWS service exceptions.
+        retryable_exceptions (tuple[type[Exception], ...] | None, optional): Exception
+            types that trigger a retry attempt. Defaults to None, which retries the
+            transient AWS service exceptions from get_retryable_aws_exceptions().
+        jitter (Literal["full", "equal", "none"], optional): How retry delays are
+            randomized. "full" waits a uniform random time up to the exponential
+            delay, "equal" waits at least half of it, and "none" disables
+            jitter. Defaults to "full".
+        cap_seconds (float | None, optional): Upper bound of any single retry delay.
+            Defaults to None, which caps delays at retry_delay_seconds * 2 ** max_retries.
+        retry_budget_seconds (float, optional): Wall-clock limit on a single call,
+            measured from its first attempt. The last backoff is shortened to fit,
+            and the error is raised once the budget is spent even if retries remain.
+            Defaults to RETRY_BUDGET_SECONDS.
+        threshold (int, optional): Consecutive failed calls, across all callers
+            of the decorated method, that open its circuit. Defaults to
+            CIRCUIT_BREAKER_FAILURE_THRESHOLD.
+        cooldown_seconds (float, optional): How long an open circuit fails fast before
+            letting a probe call through. Defaults to CIRCUIT_BREAKER_COOLDOWN_SECONDS.
 
     Returns:
         Callable: A decorator that can be applied to methods to add retry and exception handling.
 
     Raises:
+        ValueError: If jitter is not one of "full", "equal" or "none".
+        CircuitOpenError: If the decorated method's circuit is open.
         Various AWS service-specific exceptions after max retries are exhausted, including:
         - ParentNotFoundException
         - AccessDeniedException
@@ -75,66 +557,219 @@ def handle_aws_exceptions(
         def list_aws_accounts(self):
             # Method implementation that might throw AWS service exceptions
             return organizations_client.list_accounts()
+
+        The decorator also accepts coroutine methods, backing off with
+        asyncio.sleep so the event loop keeps serving other requests:
+
+        @handle_aws_exceptions()
+        async def list_aws_accounts(self):
+            return await organizations_client.list_accounts()
     """
+    if jitter not in ("full", "equal", "none"):
+        raise ValueError(f"Unsupported retry jitter strategy: {jitter}")
+    max_delay_seconds = (
+        cap_seconds if cap_seconds is not None else retry_delay_seconds * 2**max_retries
+    )
+
+    is_retryable = RetryableExceptionMatcher(retryable_exceptions)
+    is_service_failure = RetryableExceptionMatcher(
+        retryable_exceptions, get_service_failure_aws_exceptions
+    )
+
+    def get_retry_wait_time(
+        error: Exception, retries: int, deadline: float
+    ) -> float | None:
+        """Returns the backoff before the next attempt, or None when error must propagate."""
+        if not is_retryable(error):
+            _log_aws_exception(error)
+            return None
+        if retries > max_retries:
+            LOGGER.exception("Max retries (%d) exceeded", max_retries)
+            return None
+
+        remaining_seconds = deadline - time.monotonic()
+        if remaining_seconds <= 0:
+            LOGGER.exception(
+                "Retry budget of %.1f seconds exceeded", retry_budget_seconds
+            )
+            return None
+
+        wait_time = min(
+            _get_backoff_seconds(
+                retries, retry_delay_seconds, max_delay_seconds, jitter
+            ),  # Exponential backoff with jitter
+            remaining_seconds,
+        )
+        # Lazy formatting for warning log
+        LOGGER.warning(
+            "Retryable error occurred: %r. Attempt %d/%d. Retrying in %f seconds...",
+            error,
+            retries,
+            max_retries,
+            wait_time,
+        )
+        return wait_time
 
     def decorator(func: Callable) -> Callable:
+        circuit_breaker = CircuitBreakerState()
+
+        def get_wait_time(
+            error: Exception, retries: int, deadline: float, is_probe: bool
+        ) -> float | None:
+            wait_time = get_retry_wait_time(error, retries, deadline)
+            if wait_time is None:
+                # The call gives up, so it counts once however often it retried
+                circuit_breaker.record_failure(
+                    threshold, is_probe, is_service_failure(error)
+                )
+            return wait_time
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def awrapper(self, *args, **kwargs) -> Any:
+                is_probe = circuit_breaker.check(func.__qualname__, cooldown_seconds)
+                retries = 0
+                deadline = time.monotonic() + retry_budget_seconds
+                while True:
+                    try:
+                        result = await func(self, *args, **kwargs)
+                    except Exception as e:  # pylint: disable=broad-exception-caught
+                        retries += 1
+                        wait_time = get_wait_time(e, retries, deadline, is_probe)
+                        if wait_time is None:
+                            raise
+                    else:
+                        circuit_breaker.record_success()
+                        return result
+                    # Yield to the event loop instead of blocking its thread
+                    await asyncio.sleep(wait_time)
+
+            return awrapper
+
         @functools.wraps(func)
         def wrapper(self, *args, **kwargs) -> Any:
+            is_probe = circuit_breaker.check(func.__qualname__, cooldown_seconds)
             retries = 0
+            deadline = time.monotonic() + retry_budget_seconds
             while True:
                 try:
-                    return func(self, *args, **kwargs)
-
-                except retryable_exceptions as e:
+                    result = func(self, *args, **kwargs)
+                except Exception as e:  # pylint: disable=broad-exception-caught
                     retries += 1
-                    if retries > max_retries:
-                        # Lazy formatting using %r for safe representation
-                        LOGGER.error("Max retries (%d) exceeded: %r", max_retries, e)
-                        raise e
-
-                    wait_time = retry_delay_seconds * (
-                        2 ** (retries - 1)
-                    )  # Exponential backoff
-                    # Lazy formatting for warning log
-                    LOGGER.warning(
-                        "Retryable error occurred: %r. Attempt %d/%d. Retrying in %f seconds...",
-                        e,
-                        retries,
-                        max_retries,
-                        wait_time,
-                    )
-                    time.sleep(wait_time)
-                    continue
-
-                # AWS Organizations related exceptions
-                except AWS_ORGANIZATIONS_CLIENT.exceptions.ParentNotFoundException as e:
-                    # Lazy formatting for error log
-                    LOGGER.error("Invalid parent OU name: %r", e)
-                    raise e
-                except AWS_ORGANIZATIONS_CLIENT.exceptions.AccessDeniedException as e:
-                    # Lazy formatting for error log
-                    LOGGER.error("Missing required IAM policy permissions: %r", e)
-                    raise e
-
-                # AWS SSO Admin related exceptions
-                except SSO_ADMIN_CLIENT.exceptions.AccessDeniedException as e:
-                    # Lazy formatting for error log
-                    LOGGER.error("Missing required IAM policy permissions: %r", e)
-                    raise e
-                except SSO_ADMIN_CLIENT.exceptions.ServiceQuotaExceededException as e:
-                    # Lazy formatting for error log
-                    LOGGER.error(
-                        "Exceeded limit of allowed AWS account assignments, request service quota increase: %r",
-                        e,
-                    )
-                    raise e
-                except SSO_ADMIN_CLIENT.exceptions.ResourceNotFoundException as e:
-                    # Lazy formatting for error log
-                    LOGGER.error(
-                        "Invalid TargetID, PrincipalID, or PermissionSetArn: %r", e
-                    )
-                    raise e
+                    wait_time = get_wait_time(e, retries, deadline, is_probe)
+                    if wait_time is None:
+                        raise
+                else:
+                    circuit_breaker.record_success()
+                    return result
+                time.sleep(wait_time)
+
+        return wrapper
+
+    return decorator
+
+
+def cache_aws_read(
+    client_attribute: str,
+    ttl_seconds: float | None = None,
+    max_entries: int = AWS_READ_CACHE_MAX_ENTRIES,
+) -> Callable:
+    """
+    A decorator that memoizes an idempotent AWS read method in process memory.
+
+    Like the on-disk cache, it is opt-in: unless SSO_MANAGER_CACHE_TTL_SECONDS
+    is set, every call goes straight to AWS. When enabled, results are keyed on
+    the instance's boto3 client and the method's arguments, so managers sharing
+    a client in the same process share results, while reads made through any
+    other client never see them. Entries expire after the TTL and the least
+    recently used entry is evicted once max_entries is reached. Only apply it
+    to reads such as list or describe calls; mutating calls must never be cached.
+
+    Every caller gets its own shallow copy of a cached result, so mutating it
+    never changes what other callers see. The items in the result must
+    therefore be immutable, e.g. tuples or frozen dataclasses.
+
+    Concurrent misses on the same key are single-flighted: the first caller
+    runs the read while the others wait on its Future and share its result
+    or exception, so a hot key being filled is only fetched once.
+
+    Args:
+        client_attribute (str): Name of the instance attribute holding the
+            boto3 client the read goes through.
+        ttl_seconds (float | None, optional): How long a cached result is
+            reused. Defaults to None, which reads the TTL from the
+            SSO_MANAGER_CACHE_TTL_SECONDS environment variable on every call.
+        max_entries (int, optional): Maximum number of cached results.
+            Defaults to AWS_READ_CACHE_MAX_ENTRIES.
+
+    Returns:
+        Callable: A decorator whose wrapped method exposes cache_clear() to
+        drop every cached result.
+
+    Examples:
+        @cache_aws_read("_organizations_client")
+        @handle_aws_exceptions()
+        def _list_aws_child_ous(self, ou_id):
+            return self._organizations_client.list_organizational_units_for_parent(
+                ParentId=ou_id
+            )
+    """
+
+    def decorator(func: Callable) -> Callable:
+        cache: collections.OrderedDict[tuple, tuple[float, Any]] = (
+            collections.OrderedDict()
+        )
+        in_flight: dict[tuple, Future] = {}
+        lock = threading.RLock()
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs) -> Any:
+            cache_ttl_seconds = (
+                ttl_seconds if ttl_seconds is not None else get_cache_ttl_seconds()
+            )
+            if not cache_ttl_seconds:
+                return func(self, *args, **kwargs)
+
+            # The client is held by the key itself, so its id is never reused
+            key = (
+                getattr(self, client_attribute),
+                args,
+                tuple(sorted(kwargs.items())),
+            )
+            with lock:
+                entry = cache.get(key)
+                if entry is not None and entry[0] > time.monotonic():
+                    cache.move_to_end(key)
+                    return copy.copy(entry[1])
+                pending_read = in_flight.get(key)
+                if pending_read is None:
+                    pending_read = in_flight[key] = Future()
+                    is_owner = True
+                else:
+                    is_owner = False
+
+            if not is_owner:
+                return copy.copy(pending_read.result())
+
+            try:
+                result = func(self, *args, **kwargs)
+            except BaseException as e:
+                with lock:
+                    del in_flight[key]
+                pending_read.set_exception(e)
+                raise
+
+            with lock:
+                cache[key] = (time.monotonic() + cache_ttl_seconds, result)
+                cache.move_to_end(key)
+                while len(cache) > max_entries:
+                    cache.popitem(last=False)
+                del in_flight[key]
+            pending_read.set_result(result)
+            return copy.copy(result)
 
+        wrapper.cache_clear = cache.clear
         return wrapper
 
     return decorator
@@ -20,19 +20,45 @@ Key Features:
 
 import os
 import json
-from typing import Optional, Generator, List, TypedDict
+import pathlib
+import functools
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Optional, Generator, List, TypedDict
 
 import pytest
 import moto
 import boto3
+from botocore.config import Config
 from mypy_boto3_sso_admin import SSOAdminClient
 from mypy_boto3_organizations import OrganizationsClient
 from mypy_boto3_identitystore import IdentityStoreClient
 
+from src.core.constants import AWS_REQUESTS_PER_SECOND_ENV_VAR
 from src.services.aws.aws_organizations_manager import AwsAccount
 
 # Define constants
 MONKEYPATCH = pytest.MonkeyPatch()
+# Values the mock AWS env vars replaced, restored when the session ends
+PREVIOUS_AWS_ENV_VARS: dict[str, str | None] = {}
+MOCK_AWS_ENV_VARS = {
+    "AWS_SECURITY_TOKEN": "testing",
+    "AWS_SESSION_TOKEN": "test",
+    "AWS_ACCESS_KEY_ID": "test",
+    "AWS_SECRET_ACCESS_KEY": "test",
+    "AWS_DEFAULT_REGION": "us-east-1",
+    # moto never throttles, so requests are not paced client-side
+    AWS_REQUESTS_PER_SECOND_ENV_VAR: "0",
+}
+ORGANIZATION_CONFIGS_DIR = (
+    pathlib.Path(__file__).resolve().parent / "configs" / "organizations"
+)
+FIXTURE_MAX_WORKERS = 16  # Threads used to create mock AWS resources concurrently
+# moto never throttles, so retries are pure overhead; one connection per fixture thread
+MOCK_AWS_CLIENT_CONFIG = Config(
+    max_pool_connections=FIXTURE_MAX_WORKERS,
+    retries={"mode": "standard", "total_max_attempts": 1},
+)
 
 
 # Define classes
@@ -50,6 +76,87 @@ class MockAwsEnvironment(TypedDict):
 
 
 # Define helper functions
+@functools.lru_cache(maxsize=None)
+def load_organization_config(config_filename: str) -> dict:
+    """
+    Load a mock AWS environment definition from tests/configs/organizations.
+
+    Every test parametrized with the same config reuses the parsed file, so
+    it is read and decoded once per session. The returned dict is shared and
+    must be treated as read-only.
+
+    Args:
+        config_filename (str): Name of the JSON config file, e.g. "aws_org_1.json".
+
+    Returns:
+        dict: The decoded environment definition.
+    """
+    organizations_map_path = ORGANIZATION_CONFIGS_DIR / config_filename
+    with organizations_map_path.open("r", encoding="utf-8") as fp:
+        return json.load(fp)
+
+
+def bulk_create_resources(
+    executor: ThreadPoolExecutor,
+    create_method: Callable[..., dict],
+    definitions: list[dict],
+    name_key: str,
+    build_request: Callable[[dict], dict],
+    get_resource_id: Callable[[dict], str],
+) -> Iterator[tuple[str, str]]:
+    """
+    Create one mock AWS resource per definition on a thread pool.
+
+    Args:
+        executor (ThreadPoolExecutor): Pool the create calls are submitted to.
+        create_method (Callable[..., dict]): Bound client method creating one resource.
+        definitions (list[dict]): Resource definitions from the environment config.
+        name_key (str): Definition key holding the resource's name.
+        build_request (Callable[[dict], dict]): Builds the create_method keyword
+            arguments from a definition.
+        get_resource_id (Callable[[dict], str]): Extracts the new resource's ID
+            from the create_method response.
+
+    Returns:
+        Iterator[tuple[str, str]]: (name, ID) pairs in definition order. Every
+        call is submitted before this returns, so several batches can be
+        submitted before any of them is consumed.
+    """
+
+    def create_resource(definition: dict) -> tuple[str, str]:
+        response = create_method(**build_request(definition))
+        return definition[name_key], get_resource_id(response)
+
+    return executor.map(create_resource, definitions)
+
+
+def iter_organization_level(
+    ous_to_create: list[tuple[str, str, list[dict]]],
+) -> Iterator[tuple[str, str, str, dict]]:
+    """
+    Yield the creation tasks for one level of an organization definition tree.
+
+    Planning is kept apart from execution: the caller decides how to create
+    each yielded resource, and nothing is materialized beyond the level itself.
+
+    Args:
+        ous_to_create (list[tuple[str, str, list[dict]]]): (parent OU ID, parent
+            OU name, child definitions) for every OU on the level.
+
+    Yields:
+        tuple[str, str, str, dict]: (resource type, parent OU ID, parent OU name,
+        definition) for each child, in definition order.
+    """
+    for parent_ou_id, parent_ou_name, definitions in ous_to_create:
+        for organization_resource in definitions:
+            yield (
+                organization_resource["type"],
+                parent_ou_id,
+                parent_ou_name,
+                organization_resource,
+            )
+
+
 def create_aws_ous_accounts(
     orgs_client: boto3.client,
     aws_organization_definitions: list[dict],
@@ -60,7 +167,7 @@ def create_aws_ous_accounts(
     parent_ou_name: str = "root",
 ) -> tuple[dict, dict]:
     """
-    Recursively create AWS Organizational Units (OUs) and accounts.
+    Create AWS Organizational Units (OUs) and accounts, one tree level at a time.
 
     This function performs the following tasks:
     1. Create organizational units based on the provided definitions
@@ -68,6 +175,12 @@ def create_aws_ous_accounts(
     3. Move accounts to their designated organizational units
     4. Maintain mappings of account names to IDs and OU structure
 
+    The definition tree is walked breadth-first. Every OU and account on a
+    level only depends on its already created parent, so each level is
+    dispatched through a thread pool as one batch; an account's creation and
+    its move into the OU run in the same task. Results are recorded on the
+    calling thread in definition order, so the returned maps are deterministic.
+
     Args:
         orgs_client (boto3.client): AWS Organizations client for API calls.
         aws_organization_definitions (list[dict]): Hierarchical definition of
@@ -77,8 +190,8 @@ def create_aws_ous_accounts(
             Defaults to empty string.
         account_name_id_map (dict, optional): Mapping of account names to their
             AWS account IDs. Defaults to None.
-        ou_accounts_map (dict, optional): Mapping of OUs to their accounts.
-            Defaults to None.
+        ou_accounts_map (dict, optional): Mapping of OUs to their accounts to
+            extend; it is copied rather than updated in place. Defaults to None.
         parent_ou_name (str, optional): Name of the parent OU for nested creation.
             Defaults to "root".
 
@@ -90,65 +203,87 @@ def create_aws_ous_accounts(
     if account_name_id_map is None:
         account_name_id_map = {}
 
-    if ou_accounts_map is None:
-        ou_accounts_map = {}
-
-    for organization_resource in aws_organization_definitions:
-        if organization_resource["type"] == "ORGANIZATIONAL_UNIT":
-            # Create OU
-            nested_ou_id = orgs_client.create_organizational_unit(
-                ParentId=parent_ou_id if parent_ou_id else root_ou_id,
-                Name=organization_resource["name"],
-            )["OrganizationalUnit"]["Id"]
-
-            # Recursively setup OU
-            if organization_resource.get("children"):
-                create_aws_ous_accounts(
-                    orgs_client,
-                    organization_resource["children"],
-                    root_ou_id,
-                    nested_ou_id,
-                    account_name_id_map,
-                    ou_accounts_map,
-                    organization_resource["name"],
-                )
+    ou_accounts_map = defaultdict(list, ou_accounts_map or {})
+
+    def create_ou(ou_task: tuple[str, dict]) -> str:
+        ou_parent_id, ou_definition = ou_task
+        return orgs_client.create_organizational_unit(
+            ParentId=ou_parent_id if ou_parent_id else root_ou_id,
+            Name=ou_definition["name"],
+        )["OrganizationalUnit"]["Id"]
 
-        elif organization_resource["type"] == "ACCOUNT":
-            # Create account
-            account_id = orgs_client.create_account(
-                Email=f"{organization_resource['name']}@testing.com",
-                AccountName=organization_resource["name"],
-            )["CreateAccountStatus"]["AccountId"]
+    def create_account(account_task: tuple[str, str, str]) -> str:
+        account_parent_id, _, account_name = account_task
+        account_id = orgs_client.create_account(
+            Email=f"{account_name}@testing.com",
+            AccountName=account_name,
+        )["CreateAccountStatus"]["AccountId"]
 
-            # Move account to OU
+        # Move account to OU; new accounts already sit under the root
+        if account_parent_id and account_parent_id != root_ou_id:
             orgs_client.move_account(
                 AccountId=account_id,
                 SourceParentId=root_ou_id,
-                DestinationParentId=parent_ou_id,
+                DestinationParentId=account_parent_id,
             )
+        return account_id
+
+    ous_to_create: list[tuple[str, str, list[dict]]] = [
+        (parent_ou_id, parent_ou_name, aws_organization_definitions)
+    ]
+    with ThreadPoolExecutor(max_workers=FIXTURE_MAX_WORKERS) as executor:
+        while ous_to_create:
+            ou_tasks: list[tuple[str, dict]] = []
+            account_tasks: list[tuple[str, str, str]] = []
+            for (
+                resource_type,
+                task_parent_id,
+                task_parent_name,
+                definition,
+            ) in iter_organization_level(ous_to_create):
+                if resource_type == "ORGANIZATIONAL_UNIT":
+                    ou_tasks.append((task_parent_id, definition))
+                elif resource_type == "ACCOUNT":
+                    account_tasks.append(
+                        (task_parent_id, task_parent_name, definition["name"])
+                    )
+
+            # Submit the whole level before collecting either batch
+            ou_ids = executor.map(create_ou, ou_tasks)
+            account_ids = executor.map(create_account, account_tasks)
+
+            for (_, account_parent_name, account_name), account_id in zip(
+                account_tasks, account_ids
+            ):
+                # Update the account_name_id_map with the new account
+                account_name_id_map[account_name] = account_id
+
+                # Update the ou_accounts_map with the new account under the correct OU
+                ou_accounts_map[account_parent_name].append(
+                    AwsAccount(Id=account_id, Name=account_name)
+                )
 
-            # Update the account_name_id_map with the new account
-            account_name_id_map[organization_resource["name"]] = account_id
-
-            # Update the ou_accounts_map with the new account under the correct OU
-            if parent_ou_name not in ou_accounts_map:
-                ou_accounts_map[parent_ou_name] = []
-
-            account = AwsAccount(Id=account_id, Name=organization_resource["name"])
-            ou_accounts_map[parent_ou_name].append(account)
+            # Nested OUs become the next level
+            ous_to_create = [
+                (nested_ou_id, ou_definition["name"], ou_definition["children"])
+                for (_, ou_definition), nested_ou_id in zip(ou_tasks, ou_ids)
+                if ou_definition.get("children")
+            ]
 
-    return account_name_id_map, ou_accounts_map
+    # Plain dict, so lookups of unknown OUs in tests fail instead of adding keys
+    return account_name_id_map, dict(ou_accounts_map)
 
 
 def delete_aws_ous_accounts(
     orgs_client: boto3.client, root_ou_id: str, parent_ou_id: str = ""
 ) -> None:
     """
-    Recursively delete AWS accounts from organizational units.
+    Delete AWS accounts from an organizational unit and all of its descendants.
 
-    This function traverses the AWS organization structure and removes
-    accounts from specified organizational units, supporting nested
-    organizational hierarchies.
+    When deleting from the root, every account in the organization is listed
+    with a single flat paginator. For a targeted OU, the structure below it is
+    walked once, listing the accounts and child OUs of every OU exactly one
+    time. The collected accounts are then removed concurrently.
 
     Args:
         orgs_client (boto3.client): AWS Organizations client for API calls.
@@ -158,58 +293,105 @@ def delete_aws_ous_accounts(
 
     Notes:
         - Deletes accounts in the specified OU and its child OUs
+        - Skips the organization's management account
         - Uses pagination to handle large numbers of accounts and OUs
     """
-
-    # Function to delete accounts in the current OU
-    def delete_accounts_in_ou(ou_id: str) -> None:
-        accounts_to_delete = orgs_client.list_accounts_for_parent(ParentId=ou_id)[
-            "Accounts"
-        ]
-        for account in accounts_to_delete:
-            orgs_client.remove_account_from_organization(AccountId=account["Id"])
-
-    # Function to recursively delete accounts in child OUs
-    def delete_accounts_in_child_ous(parent_id: str) -> None:
-        child_ous_paginator = orgs_client.get_paginator("list_children")
+    # The management account cannot be removed from its own organization
+    management_account_id = orgs_client.describe_organization()["Organization"][
+        "MasterAccountId"
+    ]
+
+    account_ids: list[str] = []
+    if not parent_ou_id or parent_ou_id == root_ou_id:
+        # Every account in the organization goes, so no tree walk is needed
+        for page in orgs_client.get_paginator("list_accounts").paginate():
+            account_ids.extend(
+                account["Id"]
+                for account in page["Accounts"]
+                if account["Id"] != management_account_id
+            )
+        ous_to_visit = []
+    else:
+        ous_to_visit = [parent_ou_id]
+
+    # Walk the targeted subtree with an explicit stack, collecting its accounts
+    accounts_paginator = orgs_client.get_paginator("list_accounts_for_parent")
+    child_ous_paginator = orgs_client.get_paginator("list_children")
+    while ous_to_visit:
+        ou_id = ous_to_visit.pop()
+        for page in accounts_paginator.paginate(ParentId=ou_id):
+            account_ids.extend(
+                account["Id"]
+                for account in page["Accounts"]
+                if account["Id"] != management_account_id
+            )
         for page in child_ous_paginator.paginate(
-            ParentId=parent_id, ChildType="ORGANIZATIONAL_UNIT"
+            ParentId=ou_id, ChildType="ORGANIZATIONAL_UNIT"
         ):
-            for child in page.get("Children", []):
-                delete_accounts_in_ou(child["Id"])
-                delete_accounts_in_child_ous(child["Id"])
-
-    # Delete accounts in the root or specified parent OU
-    if parent_ou_id:
-        delete_accounts_in_ou(parent_ou_id)
-        delete_accounts_in_child_ous(parent_ou_id)
-    else:
-        delete_accounts_in_ou(root_ou_id)
-        delete_accounts_in_child_ous(root_ou_id)
+            ous_to_visit.extend(child["Id"] for child in page.get("Children", []))
+
+    with ThreadPoolExecutor(max_workers=FIXTURE_MAX_WORKERS) as executor:
+        list(
+            executor.map(
+                lambda account_id: orgs_client.remove_account_from_organization(
+                    AccountId=account_id
+                ),
+                account_ids,
+            )
+        )
 
 
-# Define fixtures
-@pytest.fixture(scope="session", autouse=True)
-def setup_env_vars() -> None:
+# Define pytest hooks
+def pytest_configure(config: pytest.Config) -> None:
     """
     Set up environment variables for AWS testing.
 
-    This fixture uses MonkeyPatch to set mock AWS credentials and region
-    for the entire test session, ensuring consistent test environment
-    configuration.
+    Runs before collection, so mock AWS credentials and region are in place
+    before any test module is imported or any fixture creates a boto3 client,
+    and no fixture needs to depend on them explicitly. The values are static
+    for the whole session, so they are written directly rather than through
+    MonkeyPatch, and they overwrite any real credentials so tests can never
+    reach an actual AWS account. The values they replace are saved and put
+    back by pytest_unconfigure.
 
     Env Vars Set:
     - AWS_SESSION_TOKEN: Mock session token
     - AWS_ACCESS_KEY_ID: Mock access key
     - AWS_SECRET_ACCESS_KEY: Mock secret access key
     - AWS_DEFAULT_REGION: Default testing region (us-east-1)
+    - SSO_MANAGER_AWS_REQUESTS_PER_SECOND: 0, disabling client-side rate limiting
+    """
+    PREVIOUS_AWS_ENV_VARS.update(
+        (env_var, os.environ.get(env_var)) for env_var in MOCK_AWS_ENV_VARS
+    )
+    os.environ.update(MOCK_AWS_ENV_VARS)
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Restore the environment variables set during the test session."""
+    MONKEYPATCH.undo()
+    for env_var, previous_value in PREVIOUS_AWS_ENV_VARS.items():
+        if previous_value is None:
+            os.environ.pop(env_var, None)
+        else:
+            os.environ[env_var] = previous_value
+    PREVIOUS_AWS_ENV_VARS.clear()
+
+
+# Define fixtures
+@pytest.fixture(scope="session")
+def boto3_session() -> boto3.Session:
+    """
+    Create one boto3 session shared by every mocked client fixture.
+
+    Service models and credentials are resolved on the session, so sharing it
+    means they are loaded once per test session instead of once per client.
+    moto intercepts requests from any session while its mock is active.
+
+    Returns:
+        boto3.Session: Session used to build the mocked AWS clients
     """
-    MONKEYPATCH.setenv("AWS_SECURITY_TOKEN", "testing")
-    MONKEYPATCH.setenv("AWS_SESSION_TOKEN", "test")
-    MONKEYPATCH.setenv("AWS_ACCESS_KEY_ID", "test")
-    MONKEYPATCH.setenv("AWS_SECRET_ACCESS_KEY", "test")
-    MONKEYPATCH.setenv("AWS_DEFAULT_REGION", "us-east-1")
-    yield
+    return boto3.Session()
 
 
 @pytest.fixture(scope="function")
@@ -222,6 +404,7 @@ def aws_environment_setup():
 @pytest.fixture(scope="function")
 def organizations_client(
     aws_environment_setup: pytest.fixture,
+    boto3_session: boto3.Session,
 ) -> Generator[OrganizationsClient, None, None]:
     """
     Create a mocked AWS Organizations client for testing.
@@ -233,12 +416,13 @@ def organizations_client(
     Returns:
         boto3.client: Mocked AWS Organizations client
     """
-    yield boto3.client("organizations")
+    yield boto3_session.client("organizations", config=MOCK_AWS_CLIENT_CONFIG)
 
 
 @pytest.fixture(scope="function")
 def identity_store_client(
     aws_environment_setup: pytest.fixture,
+    boto3_session: boto3.Session,
 ) -> Generator[IdentityStoreClient, None, None]:
     """
     Create a mocked AWS Identity Store client for testing.
@@ -250,12 +434,13 @@ def identity_store_client(
     Returns:
         boto3.client: Mocked AWS Identity Store client
     """
-    yield boto3.client("identitystore")
+    yield boto3_session.client("identitystore", config=MOCK_AWS_CLIENT_CONFIG)
 
 
 @pytest.fixture(scope="function")
 def sso_admin_client(
     aws_environment_setup: pytest.fixture,
+    boto3_session: boto3.Session,
 ) -> Generator[SSOAdminClient, None, None]:
     """
     Create a mocked AWS SSO Admin client for testing.
@@ -267,7 +452,7 @@ def sso_admin_client(
     Returns:
         boto3.client: Mocked AWS SSO Admin client
     """
-    yield boto3.client("sso-admin")
+    yield boto3_session.client("sso-admin", config=MOCK_AWS_CLIENT_CONFIG)
 
 
 @pytest.fixture(scope="function")
@@ -310,12 +495,7 @@ def setup_mock_aws_environment(
         - Sets relevant environment variables for further testing
     """
     # Load JSON definitions
-    cwd = os.path.dirname(os.path.realpath(__file__))
-    organizations_map_path = os.path.join(
-        cwd, "configs", "organizations", request.param
-    )
-    with open(organizations_map_path, "r", encoding="utf-8") as fp:
-        aws_environment_details = json.load(fp)
+    aws_environment_details = load_organization_config(request.param)
 
     aws_organizations_definitions = aws_environment_details.get("aws_organizations", [])
     organizations_client.create_organization()
@@ -328,50 +508,65 @@ def setup_mock_aws_environment(
 
     # Setup AWS Identity center
     identity_store_instance = sso_admin_client.list_instances()["Instances"][0]
+    identity_store_id = identity_store_instance["IdentityStoreId"]
+    identity_store_arn = identity_store_instance["InstanceArn"]
+    sso_resource_specs = (
+        (
+            identity_store_client.create_user,
+            aws_environment_details.get("sso_users", []),
+            "username",
+            lambda user: {
+                "IdentityStoreId": identity_store_id,
+                "UserName": user["username"],
+                "DisplayName": user["name"]["Formatted"],
+                "Name": user["name"],
+                "Emails": user["email"],
+            },
+            lambda response: response["UserId"],
+        ),
+        (
+            identity_store_client.create_group,
+            aws_environment_details.get("sso_groups", []),
+            "name",
+            lambda group: {
+                "IdentityStoreId": identity_store_id,
+                "DisplayName": group["name"],
+                "Description": group["description"],
+            },
+            lambda response: response["GroupId"],
+        ),
+        (
+            sso_admin_client.create_permission_set,
+            aws_environment_details.get("permission_sets", []),
+            "name",
+            lambda permission_set: {
+                "InstanceArn": identity_store_arn,
+                "Name": permission_set["name"],
+                "Description": permission_set["description"],
+            },
+            lambda response: response["PermissionSet"]["PermissionSetArn"],
+        ),
+    )
 
-    created_sso_users = {}
-    sso_users = aws_environment_details.get("sso_users", [])
-    for user in sso_users:
-        user_details = identity_store_client.create_user(
-            IdentityStoreId=identity_store_instance["IdentityStoreId"],
-            UserName=user["username"],
-            DisplayName=user["name"]["Formatted"],
-            Name=user["name"],
-            Emails=user["email"],
-        )
-        created_sso_users[user["username"]] = user_details["UserId"]
-
-    created_sso_groups = {}
-    sso_groups = aws_environment_details.get("sso_groups", [])
-    for group in sso_groups:
-        group_details = identity_store_client.create_group(
-            IdentityStoreId=identity_store_instance["IdentityStoreId"],
-            DisplayName=group["name"],
-            Description=group["description"],
-        )
-        created_sso_groups[group["name"]] = group_details["GroupId"]
-
-    created_permission_sets = {}
-    permission_set_definitions = aws_environment_details.get("permission_sets", [])
-    for permission_set in permission_set_definitions:
-        permission_set_details = sso_admin_client.create_permission_set(
-            InstanceArn=identity_store_instance["InstanceArn"],
-            Name=permission_set["name"],
-            Description=permission_set["description"],
-        )["PermissionSet"]
-        created_permission_sets[permission_set["name"]] = permission_set_details[
-            "PermissionSetArn"
+    # Users, groups and permission sets are independent, so create them all at once
+    with ThreadPoolExecutor(max_workers=FIXTURE_MAX_WORKERS) as executor:
+        created_sso_users, created_sso_groups, created_permission_sets = [
+            dict(created_resources)
+            for created_resources in [
+                bulk_create_resources(executor, *resource_spec)
+                for resource_spec in sso_resource_specs
+            ]
         ]
 
     # SET ENV VARS
     MONKEYPATCH.setenv("ROOT_OU_ID", root_ou_id)
-    MONKEYPATCH.setenv("IDENTITY_STORE_ARN", identity_store_instance["InstanceArn"])
-    MONKEYPATCH.setenv("IDENTITY_STORE_ID", identity_store_instance["IdentityStoreId"])
+    MONKEYPATCH.setenv("IDENTITY_STORE_ARN", identity_store_arn)
+    MONKEYPATCH.setenv("IDENTITY_STORE_ID", identity_store_id)
 
     yield {
         "root_ou_id": root_ou_id,
-        "identity_store_arn": identity_store_instance["InstanceArn"],
-        "identity_store_id": identity_store_instance["IdentityStoreId"],
+        "identity_store_arn": identity_store_arn,
+        "identity_store_id": identity_store_id,
         "sso_group_name_id_map": created_sso_groups,
         "sso_username_id_map": created_sso_users,
         "sso_permission_set_name_id_map": created_permission_sets,
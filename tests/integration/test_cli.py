@@ -33,11 +33,14 @@ import glob
 import operator
 import itertools
 import importlib
+import functools
+import threading
 import concurrent.futures
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
 import boto3
 import pytest
+from moto.ssoadmin.models import SSOAdminBackend
 from tests.utils import (
     generate_expected_account_assignments,
 )
@@ -238,6 +241,49 @@ def generate_invalid_assignments(
     return invalid_assignments
 
 
+def _with_lock(method: Callable, lock: threading.Lock) -> Callable:
+    """
+    Wrap a method so that calls to it never overlap.
+
+    Args:
+        method (Callable): The method to wrap.
+        lock (threading.Lock): Lock held for the duration of each call.
+
+    Returns:
+        Callable: The wrapped method.
+    """
+
+    @functools.wraps(method)
+    def locked_method(*args, **kwargs) -> Any:
+        with lock:
+            return method(*args, **kwargs)
+
+    return locked_method
+
+
+@pytest.fixture(autouse=True)
+def lock_moto_account_assignment_writes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Serialize account assignment writes inside moto's SSO Admin backend.
+
+    moto's in-memory SSO Admin backend scans and removes account assignments
+    from a plain list without locking, so concurrent deletes can miss each
+    other. AWS itself has no such limitation, so only the mocked backend is
+    locked and the manager still applies assignments with
+    MAX_CONCURRENT_ASSIGNMENT_OPERATIONS workers.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to wrap the backend methods.
+    """
+    lock = threading.Lock()
+    for method_name in ("create_account_assignment", "delete_account_assignment"):
+        monkeypatch.setattr(
+            SSOAdminBackend,
+            method_name,
+            _with_lock(getattr(SSOAdminBackend, method_name), lock),
+        )
+
+
 @pytest.mark.parametrize(
     "account_assignment_range, setup_mock_aws_environment, manifest_filepath",
     list(
@@ -138,20 +138,18 @@ def test_rules_valid_manifest_schema(manifest_filename: str) -> None:
     )
 
     # Assert that excluded names match between local and class methods
-    assert (
-        manifest_file_via_class.excluded_ou_names == excluded_ou_names_local
+    assert manifest_file_via_class.excluded_ou_names == frozenset(
+        excluded_ou_names_local
     ), "excluded_ou_names do not match"
-    assert (
-        manifest_file_via_class.excluded_account_names == excluded_account_names_local
+    assert manifest_file_via_class.excluded_account_names == frozenset(
+        excluded_account_names_local
     ), "excluded_account_names do not match"
-    assert (
-        manifest_file_via_class.excluded_sso_user_names == excluded_sso_user_names_local
+    assert manifest_file_via_class.excluded_sso_user_names == frozenset(
+        excluded_sso_user_names_local
     ), "excluded_sso_user_names do not match"
-    assert (
-        manifest_file_via_class.excluded_sso_group_names
-        == excluded_sso_group_names_local
+    assert manifest_file_via_class.excluded_sso_group_names == frozenset(
+        excluded_sso_group_names_local
     ), "excluded_sso_group_names do not match"
-    assert (
-        manifest_file_via_class.excluded_permission_set_names
-        == excluded_permission_set_names_local
+    assert manifest_file_via_class.excluded_permission_set_names == frozenset(
+        excluded_permission_set_names_local
     ), "excluded_permission_set_names do not match"
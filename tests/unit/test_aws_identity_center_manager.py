@@ -9,10 +9,20 @@ functionality, focusing on:
     - Account and OU exclusion mechanisms
 """
 
+import pathlib
+import threading
+from unittest.mock import patch
+
 import pytest
 from mypy_boto3_organizations import OrganizationsClient
 from tests.conftest import MockAwsEnvironment
+from src.core.constants import CACHE_DIR_ENV_VAR, CACHE_TTL_ENV_VAR
 from src.services.aws.aws_organizations_manager import AwsOrganizationsManager
+from src.services.aws import aws_identity_center_manager
+from src.services.aws.aws_identity_center_manager import (
+    AccountAssignment,
+    IdentityCenterManager,
+)
 
 
 @pytest.mark.parametrize(
@@ -65,3 +75,171 @@ def test_list_active_included_aws_accounts(
     assert sorted(active_aws_accounts_via_class) == sorted(
         active_aws_account_names_via_boto3
     )
+
+
+@pytest.mark.parametrize(
+    "setup_mock_aws_environment",
+    ["aws_org_1.json", "aws_org_2.json"],
+    indirect=["setup_mock_aws_environment"],
+)
+def test_sso_environment_cache(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+    setup_mock_aws_environment: MockAwsEnvironment,
+) -> None:
+    """
+    This test verifies that, with caching enabled, a second IdentityCenterManager
+    loads SSO users, groups and permission sets from the on-disk cache, unless
+    a refresh is forced.
+
+    Test Strategy:
+        1. Enables the cache in a temporary directory
+        2. Initializes IdentityCenterManager to map and cache the SSO environment
+        3. Initializes IdentityCenterManager again with the mapping patched out
+        4. Initializes IdentityCenterManager with force_refresh and the mapping patched out
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to set cache environment variables
+        tmp_path (pathlib.Path): Temporary directory holding the cache file
+        setup_mock_aws_environment (pytest.fixture): Fixture providing mockAWS environment setup
+
+    Asserts:
+        - The cached SSO maps match those created in the mock environment
+        - The SSO environment is only mapped again when a refresh is forced
+    """
+    # Arrange
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path))
+    monkeypatch.setenv(CACHE_TTL_ENV_VAR, "300")
+    IdentityCenterManager()
+
+    # Act
+    with patch.object(
+        IdentityCenterManager, "_map_sso_environment"
+    ) as mock_map_sso_environment:
+        cached_identity_center_manager = IdentityCenterManager()
+        mock_map_sso_environment.assert_not_called()
+
+        IdentityCenterManager(force_refresh=True)
+
+    # Assert
+    mock_map_sso_environment.assert_called_once()
+    assert (
+        cached_identity_center_manager.sso_users
+        == setup_mock_aws_environment["sso_username_id_map"]
+    )
+    assert (
+        cached_identity_center_manager.sso_groups
+        == setup_mock_aws_environment["sso_group_name_id_map"]
+    )
+    assert (
+        cached_identity_center_manager.sso_permission_sets
+        == setup_mock_aws_environment["sso_permission_set_name_id_map"]
+    )
+
+
+@pytest.mark.parametrize(
+    "setup_mock_aws_environment",
+    ["aws_org_1.json"],
+    indirect=["setup_mock_aws_environment"],
+)
+def test_permission_set_names_cache(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+    setup_mock_aws_environment: MockAwsEnvironment,
+) -> None:
+    """
+    This test verifies that, with caching enabled, permission sets described on
+    a previous run are resolved from the on-disk cache, even when the SSO
+    environment itself is mapped again.
+
+    Test Strategy:
+        1. Enables the cache in a temporary directory
+        2. Initializes IdentityCenterManager to describe and cache permission sets
+        3. Initializes IdentityCenterManager with force_refresh and describes patched out
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to set cache environment variables
+        tmp_path (pathlib.Path): Temporary directory holding the cache files
+        setup_mock_aws_environment (pytest.fixture): Fixture providing mockAWS environment setup
+
+    Asserts:
+        - No permission set is described again
+        - The permission set map matches the one created in the mock environment
+    """
+    # Arrange
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path))
+    monkeypatch.setenv(CACHE_TTL_ENV_VAR, "300")
+    IdentityCenterManager()
+
+    # Act
+    with patch.object(
+        IdentityCenterManager, "_describe_permission_set"
+    ) as mock_describe_permission_set:
+        refreshed_identity_center_manager = IdentityCenterManager(force_refresh=True)
+
+    # Assert
+    mock_describe_permission_set.assert_not_called()
+    assert (
+        refreshed_identity_center_manager.sso_permission_sets
+        == setup_mock_aws_environment["sso_permission_set_name_id_map"]
+    )
+
+
+def test_account_assignment_operations_run_concurrently_and_stop_on_failure(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    This test verifies that account assignment operations run on more than one
+    worker, and that the operations not yet started are cancelled once one fails.
+
+    Test Strategy:
+        1. Allows two concurrent assignment operations
+        2. Makes the first two operations wait for each other on a barrier,
+           which only succeeds if they run at the same time
+        3. Fails the first operation and holds the second one briefly
+        4. Records every later operation that actually runs
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to raise the worker count
+
+    Asserts:
+        - The failing operation's error is raised to the caller
+        - At most one later operation, picked up by the freed worker before
+          the cancellation, runs at all
+    """
+    # Arrange
+    monkeypatch.setattr(
+        aws_identity_center_manager, "MAX_CONCURRENT_ASSIGNMENT_OPERATIONS", 2
+    )
+    assignments = [
+        AccountAssignment(
+            PrincipalId="user-id",
+            PrincipalType="USER",
+            PermissionSetArn="permission-set-arn",
+            InstanceArn="instance-arn",
+            TargetId=str(account_number),
+        )
+        for account_number in range(10)
+    ]
+    both_started = threading.Barrier(2, timeout=5)
+    later_target_ids: list[str] = []
+
+    def operation(assignment: AccountAssignment) -> None:
+        if assignment.TargetId in ("0", "1"):
+            both_started.wait()
+            if assignment.TargetId == "0":
+                raise RuntimeError("assignment failed")
+            threading.Event().wait(timeout=0.2)
+        else:
+            later_target_ids.append(assignment.TargetId)
+            threading.Event().wait(timeout=0.2)
+
+    # Act
+    identity_center_manager = IdentityCenterManager.__new__(IdentityCenterManager)
+    with pytest.raises(RuntimeError, match="assignment failed"):
+        identity_center_manager._run_account_assignment_operations(  # pylint: disable=protected-access
+            operation, assignments, "Creating account assignments"
+        )
+
+    # Assert
+    assert len(later_target_ids) <= 1
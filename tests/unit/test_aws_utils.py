@@ -0,0 +1,532 @@
+"""
+Unit tests for the AWS helpers in the src.services.aws.utils module.
+"""
+
+import asyncio
+import inspect
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from botocore.exceptions import EndpointConnectionError
+from mypy_boto3_organizations import OrganizationsClient
+from src.core.constants import (
+    AWS_REQUESTS_PER_SECOND_ENV_VAR,
+    CACHE_TTL_ENV_VAR,
+    ORGANIZATIONS_REQUESTS_PER_SECOND,
+)
+from src.services.aws.exceptions import CircuitOpenError
+from src.services.aws.utils import (
+    AWS_CLIENT_CONFIG,
+    CircuitBreakerState,
+    TokenBucket,
+    cache_aws_read,
+    get_aws_client,
+    get_retryable_aws_exceptions,
+    get_token_bucket,
+    handle_aws_exceptions,
+)
+
+
+class TransientError(Exception):
+    """Stand-in for a retryable AWS service exception."""
+
+
+class FlakyCaller:
+    """
+    Minimal object whose decorated method fails a set number of times
+    before succeeding, mirroring how manager methods are wrapped.
+    """
+
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.calls = 0
+
+    def call(self) -> str:
+        """Raises TransientError until the configured failures are exhausted."""
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise TransientError("throttled")
+        return "ok"
+
+
+def _decorate(**kwargs) -> type:
+    """Builds a FlakyCaller subclass whose call method is wrapped by the decorator."""
+
+    class DecoratedCaller(FlakyCaller):
+        """FlakyCaller with handle_aws_exceptions applied to call."""
+
+        @handle_aws_exceptions(retryable_exceptions=(TransientError,), **kwargs)
+        def call(self) -> str:
+            return super().call()
+
+    return DecoratedCaller
+
+
+@pytest.mark.parametrize(
+    "jitter, lower_bound_ratio",
+    [("full", 0.0), ("equal", 0.5)],
+)
+def test_jittered_backoff_stays_within_bounds(
+    jitter: str, lower_bound_ratio: float
+) -> None:
+    """
+    Verify that jittered retry delays never exceed the exponential delay
+    for each attempt, nor fall below the strategy's lower bound.
+    """
+    caller = _decorate(
+        max_retries=5, retry_delay_seconds=1, jitter=jitter, cap_seconds=4
+    )(failures=5)
+
+    with patch("src.services.aws.utils.time.sleep") as mock_sleep:
+        assert caller.call() == "ok"
+
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    assert len(delays) == 5
+    for attempt, delay in enumerate(delays, start=1):
+        exponential_delay = min(4, 2 ** (attempt - 1))
+        assert exponential_delay * lower_bound_ratio <= delay <= exponential_delay
+
+
+def test_backoff_without_jitter_is_deterministic() -> None:
+    """
+    Verify that disabling jitter restores the plain capped exponential delays.
+    """
+    caller = _decorate(
+        max_retries=4, retry_delay_seconds=1, jitter="none", cap_seconds=4
+    )(failures=4)
+
+    with patch("src.services.aws.utils.time.sleep") as mock_sleep:
+        assert caller.call() == "ok"
+
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [1, 2, 4, 4]
+
+
+def test_unsupported_jitter_strategy() -> None:
+    """
+    Verify that an unknown jitter strategy is rejected when decorating.
+    """
+    with pytest.raises(ValueError):
+        handle_aws_exceptions(jitter="partial")
+
+
+def test_async_methods_retry_without_blocking() -> None:
+    """
+    Verify that coroutine methods stay coroutines and back off with
+    asyncio.sleep rather than blocking the event loop thread.
+    """
+
+    class AsyncCaller(FlakyCaller):
+        """FlakyCaller exposing an async call method."""
+
+        @handle_aws_exceptions(
+            retryable_exceptions=(TransientError,), retry_delay_seconds=1
+        )
+        async def acall(self) -> str:
+            """Coroutine wrapper around the flaky call."""
+            return self.call()
+
+    caller = AsyncCaller(failures=2)
+    assert inspect.iscoroutinefunction(AsyncCaller.acall)
+
+    with patch("src.services.aws.utils.time.sleep") as mock_sleep, patch(
+        "src.services.aws.utils.asyncio.sleep", new_callable=AsyncMock
+    ) as mock_async_sleep:
+        assert asyncio.run(caller.acall()) == "ok"
+
+    mock_sleep.assert_not_called()
+    assert mock_async_sleep.await_count == 2
+
+
+def test_circuit_opens_after_consecutive_failures() -> None:
+    """
+    Verify that once the failure threshold of failed calls is reached, further
+    calls fail fast with CircuitOpenError without reaching the wrapped method,
+    that each call counts once however often it retried, and that a successful
+    probe after the cooldown closes the circuit again.
+    """
+    caller = _decorate(max_retries=1, threshold=2, cooldown_seconds=30)(failures=4)
+
+    with patch("src.services.aws.utils.time.sleep"):
+        with pytest.raises(TransientError):
+            caller.call()
+        with pytest.raises(TransientError):
+            caller.call()
+        with pytest.raises(CircuitOpenError):
+            caller.call()
+        assert caller.calls == 4
+
+        # Let the cooldown elapse so the next call is allowed through as a probe
+        opened_at = time.monotonic()
+        with patch(
+            "src.services.aws.utils.time.monotonic", return_value=opened_at + 31
+        ):
+            assert caller.call() == "ok"
+        assert caller.call() == "ok"
+
+
+def test_conflicts_do_not_open_the_circuit() -> None:
+    """
+    Verify that calls giving up on ConflictException, which is retried but
+    routine during concurrent assignment writes, never open the circuit.
+    """
+    conflict = get_aws_client("sso-admin").exceptions.ConflictException
+    error = conflict(
+        {"Error": {"Code": "ConflictException", "Message": "provisioning"}},
+        "CreateAccountAssignment",
+    )
+
+    class ConflictingCaller:
+        """Raises the prepared ConflictException on every call."""
+
+        calls = 0
+
+        @handle_aws_exceptions(max_retries=0, threshold=1)
+        def call(self) -> None:
+            """Raises the ConflictException."""
+            ConflictingCaller.calls += 1
+            raise error
+
+    for _ in range(3):
+        with pytest.raises(conflict):
+            ConflictingCaller().call()
+    assert ConflictingCaller.calls == 3
+
+
+def test_half_open_circuit_admits_a_single_probe() -> None:
+    """
+    Verify that after the cooldown only one probe call is let through, that
+    late failures of calls started before the circuit opened do not extend the
+    cooldown, and that a failed probe reopens the circuit for a fresh cooldown.
+    """
+    circuit_breaker = CircuitBreakerState()
+    now = time.monotonic()
+    with patch("src.services.aws.utils.time.monotonic", return_value=now):
+        circuit_breaker.record_failure(threshold=1, is_probe=False)
+
+    # A call that started before the circuit opened fails later on
+    with patch("src.services.aws.utils.time.monotonic", return_value=now + 20):
+        circuit_breaker.record_failure(threshold=1, is_probe=False)
+
+    with patch("src.services.aws.utils.time.monotonic", return_value=now + 31):
+        assert circuit_breaker.check("call", cooldown_seconds=30) is True
+        with pytest.raises(CircuitOpenError, match="probe in flight"):
+            circuit_breaker.check("call", cooldown_seconds=30)
+        circuit_breaker.record_failure(threshold=1, is_probe=True)
+
+    with patch("src.services.aws.utils.time.monotonic", return_value=now + 60):
+        with pytest.raises(CircuitOpenError, match="retry in"):
+            circuit_breaker.check("call", cooldown_seconds=30)
+
+    with patch("src.services.aws.utils.time.monotonic", return_value=now + 62):
+        assert circuit_breaker.check("call", cooldown_seconds=30) is True
+        circuit_breaker.record_success()
+        assert circuit_breaker.check("call", cooldown_seconds=30) is False
+
+
+def test_cached_reads_expire_and_evict() -> None:
+    """
+    Verify that cached reads are shared across instances, expire after their
+    TTL, and evict the least recently used entry once full.
+    """
+
+    class ReadCaller:
+        """Counts how often the underlying read actually runs."""
+
+        calls: list[str] = []
+        client = object()
+
+        @cache_aws_read("client", ttl_seconds=60, max_entries=2)
+        def read(self, ou_id: str) -> str:
+            """Records the call and echoes the OU ID."""
+            self.calls.append(ou_id)
+            return ou_id
+
+    now = time.monotonic()
+    with patch("src.services.aws.utils.time.monotonic", return_value=now):
+        assert ReadCaller().read("ou-1") == ReadCaller().read("ou-1") == "ou-1"
+        assert ReadCaller.calls == ["ou-1"]
+
+        # A third key evicts the least recently used one
+        ReadCaller().read("ou-2")
+        ReadCaller().read("ou-3")
+        ReadCaller().read("ou-1")
+        assert ReadCaller.calls == ["ou-1", "ou-2", "ou-3", "ou-1"]
+
+    with patch("src.services.aws.utils.time.monotonic", return_value=now + 61):
+        ReadCaller().read("ou-1")
+    assert ReadCaller.calls[-1] == "ou-1" and len(ReadCaller.calls) == 5
+
+
+def test_cached_reads_are_opt_in_per_client_and_copied(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Verify that cached reads are disabled unless the cache TTL is set, are
+    never shared between different clients, and that mutating a returned
+    result does not change what later callers get.
+    """
+
+    class ClientReadCaller:
+        """Reads through its own client, counting every call."""
+
+        calls: list[str] = []
+
+        def __init__(self, client: object) -> None:
+            self.client = client
+
+        @cache_aws_read("client")
+        def read(self, ou_id: str) -> list[str]:
+            """Records the call and returns the OU ID in a list."""
+            self.calls.append(ou_id)
+            return [ou_id]
+
+    client = object()
+    monkeypatch.delenv(CACHE_TTL_ENV_VAR, raising=False)
+    ClientReadCaller(client).read("ou-1")
+    ClientReadCaller(client).read("ou-1")
+    assert ClientReadCaller.calls == ["ou-1", "ou-1"]
+
+    monkeypatch.setenv(CACHE_TTL_ENV_VAR, "60")
+    ClientReadCaller(client).read("ou-1").append("ou-2")
+    assert ClientReadCaller(client).read("ou-1") == ["ou-1"]
+    assert len(ClientReadCaller.calls) == 3
+
+    ClientReadCaller(object()).read("ou-1")
+    assert len(ClientReadCaller.calls) == 4
+
+
+def test_token_bucket_paces_calls_after_burst() -> None:
+    """
+    Verify that the token bucket allows a burst up to its capacity and then
+    makes each further caller wait for its own refilled token.
+    """
+    now = time.monotonic()
+    with patch("src.services.aws.utils.time.monotonic", return_value=now):
+        bucket = TokenBucket(rate=10, capacity=2)
+        assert [bucket.reserve() for _ in range(4)] == pytest.approx(
+            [0.0, 0.0, 0.1, 0.2]
+        )
+
+    # A full second later the debt is repaid and the bucket holds the remainder
+    with patch("src.services.aws.utils.time.monotonic", return_value=now + 1):
+        assert bucket.reserve() == 0.0
+
+
+def test_default_retryable_exceptions_match_shared_clients() -> None:
+    """
+    Verify that the default retryable exceptions are the classes raised by the
+    shared clients, since botocore builds distinct classes per session.
+    """
+    retryable_exceptions = get_retryable_aws_exceptions()
+    assert (
+        get_aws_client("sso-admin").exceptions.ThrottlingException
+        in retryable_exceptions
+    )
+    assert (
+        get_aws_client("organizations").exceptions.TooManyRequestsException
+        in retryable_exceptions
+    )
+
+
+def test_non_retryable_aws_exception_is_logged_and_raised() -> None:
+    """
+    Verify that a non-retryable AWS exception is logged with its known cause
+    and re-raised to the caller without any retry.
+    """
+    resource_not_found = get_aws_client(
+        "sso-admin"
+    ).exceptions.ResourceNotFoundException
+    error = resource_not_found(
+        {"Error": {"Code": "ResourceNotFoundException", "Message": "missing"}},
+        "DeleteAccountAssignment",
+    )
+
+    class FailingCaller:
+        """Raises the prepared AWS exception on every call."""
+
+        @handle_aws_exceptions()
+        def call(self) -> None:
+            """Raises the ResourceNotFoundException."""
+            raise error
+
+    with patch("src.services.aws.utils.LOGGER") as mock_logger, patch(
+        "src.services.aws.utils.time.sleep"
+    ) as mock_sleep:
+        with pytest.raises(resource_not_found):
+            FailingCaller().call()
+
+    mock_sleep.assert_not_called()
+    mock_logger.exception.assert_called_once_with(
+        "Invalid TargetID, PrincipalID, or PermissionSetArn"
+    )
+
+
+def test_retry_budget_bounds_total_backoff() -> None:
+    """
+    Verify that a call gives up once its retry budget is spent, shortening the
+    last backoff to fit, even though retries remain.
+    """
+    clock = [0.0]
+    caller = _decorate(
+        max_retries=5, retry_delay_seconds=2, jitter="none", retry_budget_seconds=5
+    )(failures=5)
+
+    def fake_sleep(seconds: float) -> None:
+        clock[0] += seconds
+
+    with patch(
+        "src.services.aws.utils.time.monotonic", side_effect=lambda: clock[0]
+    ), patch("src.services.aws.utils.time.sleep", side_effect=fake_sleep) as sleep:
+        with pytest.raises(TransientError):
+            caller.call()
+
+    assert [call.args[0] for call in sleep.call_args_list] == [2, 3]
+    assert caller.calls == 3
+
+
+def test_concurrent_cache_misses_share_one_read() -> None:
+    """
+    Verify that concurrent misses on the same key wait for the read already
+    in flight instead of each calling AWS.
+    """
+    read_started = threading.Event()
+    release_read = threading.Event()
+
+    class SlowReadCaller:
+        """Blocks its first read until released, counting every call."""
+
+        calls: list[str] = []
+        client = object()
+
+        @cache_aws_read("client", ttl_seconds=60)
+        def read(self, ou_id: str) -> str:
+            """Records the call and waits until the test releases it."""
+            self.calls.append(ou_id)
+            read_started.set()
+            release_read.wait(timeout=5)
+            return ou_id
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        owner = executor.submit(SlowReadCaller().read, "ou-1")
+        read_started.wait(timeout=5)
+        waiters = [executor.submit(SlowReadCaller().read, "ou-1") for _ in range(3)]
+        release_read.set()
+        results = [owner.result()] + [waiter.result() for waiter in waiters]
+
+    assert results == ["ou-1"] * 4
+    assert SlowReadCaller.calls == ["ou-1"]
+
+
+def test_organizations_throttling_from_shared_client_is_retried() -> None:
+    """
+    Verify that a throttling error raised by the shared Organizations client
+    is retried by the default decorator settings rather than propagated.
+    """
+    too_many_requests = get_aws_client(
+        "organizations"
+    ).exceptions.TooManyRequestsException
+    error = too_many_requests(
+        {"Error": {"Code": "TooManyRequestsException", "Message": "slow down"}},
+        "ListAccountsForParent",
+    )
+
+    class ThrottledCaller:
+        """Raises the prepared throttling error once, then succeeds."""
+
+        calls = 0
+
+        @handle_aws_exceptions()
+        def call(self) -> str:
+            """Raises TooManyRequestsException on the first call only."""
+            ThrottledCaller.calls += 1
+            if ThrottledCaller.calls == 1:
+                raise error
+            return "ok"
+
+    with patch("src.services.aws.utils.time.sleep") as mock_sleep:
+        assert ThrottledCaller().call() == "ok"
+
+    assert ThrottledCaller.calls == 2
+    mock_sleep.assert_called_once()
+
+
+def test_shared_client_paces_every_paginated_request(
+    monkeypatch: pytest.MonkeyPatch,
+    organizations_client: OrganizationsClient,
+) -> None:
+    """
+    Verify that, with client-side rate limiting enabled, a shared Organizations
+    client takes a token from the service's bucket for every API request, one
+    per paginator page.
+    """
+    organizations_client.create_organization(FeatureSet="ALL")
+    for account_number in range(3):
+        organizations_client.create_account(
+            AccountName=f"account-{account_number}",
+            Email=f"account-{account_number}@example.com",
+        )
+
+    # The test session disables rate limiting, so build a paced client here
+    monkeypatch.setenv(AWS_REQUESTS_PER_SECOND_ENV_VAR, "1000")
+    get_token_bucket.cache_clear()
+    try:
+        paced_client = get_aws_client.__wrapped__("organizations")
+        with patch.object(TokenBucket, "acquire") as mock_acquire:
+            pages = list(
+                paced_client.get_paginator("list_accounts").paginate(
+                    PaginationConfig={"PageSize": 1}
+                )
+            )
+    finally:
+        get_token_bucket.cache_clear()
+
+    assert len(pages) == 4
+    assert mock_acquire.call_count == len(pages)
+
+
+def test_rate_limiting_can_be_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Verify that setting the request rate override to 0 disables client-side
+    rate limiting, and that an invalid override falls back to the default rate.
+    """
+    monkeypatch.setenv(AWS_REQUESTS_PER_SECOND_ENV_VAR, "0")
+    get_token_bucket.cache_clear()
+    try:
+        assert get_token_bucket("organizations") is None
+
+        monkeypatch.setenv(AWS_REQUESTS_PER_SECOND_ENV_VAR, "fast")
+        get_token_bucket.cache_clear()
+        token_bucket = get_token_bucket("organizations")
+        assert token_bucket.rate == ORGANIZATIONS_REQUESTS_PER_SECOND
+    finally:
+        get_token_bucket.cache_clear()
+
+
+def test_connection_errors_are_retried_by_the_decorator_only() -> None:
+    """
+    Verify that the shared clients make a single attempt per call, leaving
+    the retry of connection errors to the decorator.
+    """
+    assert AWS_CLIENT_CONFIG.retries["total_max_attempts"] == 1
+
+    class UnreachableCaller:
+        """Fails to connect once, then succeeds."""
+
+        calls = 0
+
+        @handle_aws_exceptions()
+        def call(self) -> str:
+            """Raises EndpointConnectionError on the first call only."""
+            UnreachableCaller.calls += 1
+            if UnreachableCaller.calls == 1:
+                raise EndpointConnectionError(endpoint_url="https://example.com")
+            return "ok"
+
+    with patch("src.services.aws.utils.time.sleep") as mock_sleep:
+        assert UnreachableCaller().call() == "ok"
+
+    assert UnreachableCaller.calls == 2
+    mock_sleep.assert_called_once()
@@ -7,12 +7,18 @@ functionality, focusing on:
     - AWS account listing
     - Organizational unit handling
     - Account and OU exclusion mechanisms
+    - On-disk caching of the organization map
 """
 
+import pathlib
+from unittest.mock import patch
+
 import pytest
 from mypy_boto3_organizations import OrganizationsClient
 
 from tests.conftest import MockAwsEnvironment
+from src.core.constants import CACHE_DIR_ENV_VAR, CACHE_TTL_ENV_VAR
+from src.services.aws.utils import get_aws_client
 from src.services.aws.aws_organizations_manager import AwsOrganizationsManager
 
 
@@ -66,3 +72,197 @@ def test_list_active_included_aws_accounts(
     assert sorted(active_aws_accounts_via_class) == sorted(
         active_aws_account_names_via_boto3
     )
+
+
+@pytest.mark.parametrize(
+    "setup_mock_aws_environment",
+    ["aws_org_1.json", "aws_org_2.json"],
+    indirect=["setup_mock_aws_environment"],
+)
+def test_ou_name_id_map(
+    organizations_client: OrganizationsClient,
+    setup_mock_aws_environment: MockAwsEnvironment,
+) -> None:
+    """
+    This test verifies that the OU name to ID map built during the organization
+    walk matches the OUs described directly through boto3.
+
+    Test Strategy:
+        1. Initializes AwsOrganizationsManager
+        2. Checks every mapped OU has an entry in the OU accounts map
+        3. Describes each mapped OU ID via boto3 and compares its name
+
+    Args:
+        organizations_client (OrganizationsClient): Mocked AWS Organizations client
+        setup_mock_aws_environment (pytest.fixture): Fixture providing mockAWS environment setup
+
+    Asserts:
+        - The OU name to ID map and the OU accounts map cover the same OUs
+        - The root OU is keyed as 'root'
+        - Every other OU ID resolves to the OU name it is keyed under
+    """
+    # Arrange
+    py_aws_organizations = AwsOrganizationsManager()
+
+    # Act
+    ou_name_id_map = py_aws_organizations.ou_name_id_map
+
+    # Assert
+    assert ou_name_id_map.keys() == py_aws_organizations.ou_accounts_map.keys()
+    assert ou_name_id_map["root"] == setup_mock_aws_environment["root_ou_id"]
+    for ou_name, ou_id in ou_name_id_map.items():
+        if ou_name == "root":
+            continue
+        ou_details = organizations_client.describe_organizational_unit(
+            OrganizationalUnitId=ou_id
+        )
+        assert ou_details["OrganizationalUnit"]["Name"] == ou_name
+
+
+@pytest.mark.parametrize(
+    "setup_mock_aws_environment",
+    ["aws_org_1.json"],
+    indirect=["setup_mock_aws_environment"],
+)
+def test_revisited_ous_are_mapped_once(
+    organizations_client: OrganizationsClient,
+    setup_mock_aws_environment: MockAwsEnvironment,
+) -> None:
+    """
+    This test verifies that the organization walk terminates and maps each OU
+    once, even if an OU is reported as a child of itself and of the root.
+
+    Test Strategy:
+        1. Patches child OU listing so every OU reports the same child OU
+        2. Initializes AwsOrganizationsManager
+        3. Checks how many times each OU was listed
+
+    Args:
+        organizations_client (OrganizationsClient): Mocked AWS Organizations client
+        setup_mock_aws_environment (pytest.fixture): Fixture providing mockAWS environment setup
+
+    Asserts:
+        - The walk terminates
+        - The root OU and the repeated child OU are each listed once
+    """
+    # Arrange
+    root_ou_id = setup_mock_aws_environment["root_ou_id"]
+    child_ou = organizations_client.list_organizational_units_for_parent(
+        ParentId=root_ou_id
+    )["OrganizationalUnits"][0]
+    repeated_child_ou = (child_ou["Id"], child_ou["Name"])
+
+    # Act
+    with patch.object(
+        AwsOrganizationsManager,
+        "_list_aws_child_ous",
+        return_value=[repeated_child_ou],
+    ) as mock_list_aws_child_ous:
+        py_aws_organizations = AwsOrganizationsManager()
+
+    # Assert
+    listed_ou_ids = [call.args[0] for call in mock_list_aws_child_ous.call_args_list]
+    assert sorted(listed_ou_ids) == sorted([root_ou_id, repeated_child_ou[0]])
+    assert py_aws_organizations.ou_name_id_map == {
+        "root": root_ou_id,
+        repeated_child_ou[1]: repeated_child_ou[0],
+    }
+
+
+@pytest.mark.parametrize(
+    "setup_mock_aws_environment",
+    ["aws_org_1.json", "aws_org_2.json"],
+    indirect=["setup_mock_aws_environment"],
+)
+def test_provided_root_ou_id(
+    setup_mock_aws_environment: MockAwsEnvironment,
+) -> None:
+    """
+    This test verifies that a provided root OU ID is used as-is instead of
+    being discovered through the ListRoots API.
+
+    Test Strategy:
+        1. Initializes AwsOrganizationsManager with auto-discovery
+        2. Initializes AwsOrganizationsManager with the root OU ID, with ListRoots patched
+        3. Compares the maps of both instances
+
+    Args:
+        setup_mock_aws_environment (pytest.fixture): Fixture providing mockAWS environment setup
+
+    Asserts:
+        - ListRoots is not called when the root OU ID is provided
+        - Both instances map the same organization
+    """
+    # Arrange
+    root_ou_id = setup_mock_aws_environment["root_ou_id"]
+    py_aws_organizations = AwsOrganizationsManager()
+
+    # Act
+    with patch.object(get_aws_client("organizations"), "list_roots") as mock_list_roots:
+        provided_root_py_aws_organizations = AwsOrganizationsManager(
+            root_ou_id=root_ou_id
+        )
+
+    # Assert
+    mock_list_roots.assert_not_called()
+    assert provided_root_py_aws_organizations.ou_name_id_map["root"] == root_ou_id
+    assert (
+        provided_root_py_aws_organizations.ou_accounts_map
+        == py_aws_organizations.ou_accounts_map
+    )
+
+
+@pytest.mark.parametrize(
+    "setup_mock_aws_environment",
+    ["aws_org_1.json", "aws_org_2.json"],
+    indirect=["setup_mock_aws_environment"],
+)
+def test_organization_map_cache(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+    setup_mock_aws_environment: MockAwsEnvironment,  # pylint: disable=unused-argument
+) -> None:
+    """
+    This test verifies that, with caching enabled, a second AwsOrganizationsManager
+    is built from the on-disk cache instead of walking the organization again.
+
+    Test Strategy:
+        1. Enables the cache in a temporary directory
+        2. Initializes AwsOrganizationsManager to walk and cache the organization
+        3. Initializes a second AwsOrganizationsManager with the walk patched out
+        4. Compares the maps of both instances
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to set cache environment variables
+        tmp_path (pathlib.Path): Temporary directory holding the cache file
+        setup_mock_aws_environment (pytest.fixture): Fixture providing mockAWS environment setup
+
+    Asserts:
+        - The second instance does not walk the organization
+        - The cached maps match the maps built by the walk
+    """
+    # Arrange
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path))
+    monkeypatch.setenv(CACHE_TTL_ENV_VAR, "300")
+    py_aws_organizations = AwsOrganizationsManager()
+
+    # Act
+    with patch.object(
+        AwsOrganizationsManager, "_generate_aws_organization_map"
+    ) as mock_generate_aws_organization_map:
+        cached_py_aws_organizations = AwsOrganizationsManager()
+
+    # Assert
+    mock_generate_aws_organization_map.assert_not_called()
+    assert (
+        cached_py_aws_organizations.ou_accounts_map
+        == py_aws_organizations.ou_accounts_map
+    )
+    assert (
+        cached_py_aws_organizations.accounts_name_id_map
+        == py_aws_organizations.accounts_name_id_map
+    )
+    assert (
+        cached_py_aws_organizations.ou_name_id_map
+        == py_aws_organizations.ou_name_id_map
+    )